@@ -2,26 +2,46 @@
 Main CTO Agent class that handles conversations with Claude.
 """
 
-import json
-import sys
-from pathlib import Path
-from typing import Optional
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Iterator, Optional
 
 from anthropic import Anthropic
 from rich.console import Console
+from rich.live import Live
 from rich.markdown import Markdown
 from rich.panel import Panel
 from rich import box
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from config import load_config
-from agent.tools import TOOLS, execute_tool
-from agent.prompts import get_system_prompt
+from agent.tools import TOOLS, clear_cache, execute_tool
+from agent.prompts import get_system_prompt, with_report_template
+from utils.serialization import dumps_json
 
 console = Console()
 
+# Tools that must not run alongside other tool calls (e.g. ones with side effects)
+SEQUENTIAL_TOOLS: set[str] = set()
+
+# Upper bound on concurrent tool executions per assistant turn
+MAX_TOOL_WORKERS = 8
+
+# Characters of a tool result kept once it falls outside the history window
+SUMMARY_CHARS = 200
+
+# User turns the history window may overrun before it is compacted in one go;
+# each compaction rewrites the cached prompt prefix, so it happens in batches
+COMPACT_BATCH_TURNS = 5
+
+# Output token budget bounds; MAX_OUTPUT_TOKENS is always used for long-form requests
+MIN_OUTPUT_TOKENS = 512
+MAX_OUTPUT_TOKENS = 4096
+LONG_OUTPUT_RE = re.compile(r"weekly|report|summary of the (week|month)", re.IGNORECASE)
+
+# Redraws per second of the streamed answer; Markdown is rebuilt at most this often
+LIVE_REFRESH_PER_SECOND = 8
+
 
 class CTOAgent:
     """Conversational CTO agent powered by Claude."""
@@ -39,164 +59,340 @@ class CTOAgent:
         self.model = model
         self.system_prompt = get_system_prompt()
         self.messages: list[dict] = []
+        self.max_history_turns = 10
+        # Messages before this index already have their tool results summarized
+        self._compacted_until = 0
+        self._ema_out_tokens = 512.0
+        self._long_output = False
 
     def clear_history(self):
         """Clear conversation history."""
         self.messages = []
+        self._compacted_until = 0
+        clear_cache()
 
-    def chat(self, user_message: str) -> str:
-        """Send a message and get a response, handling tool use."""
-
-        # Add user message to history
-        self.messages.append({"role": "user", "content": user_message})
+    def chat(self, user_message: str, out: Console = console) -> str:
+        """Send a message and get a response, handling tool use; tool progress is printed on out."""
 
-        # Initial API call
-        response = self._call_api()
+        self._add_user_message(user_message)
 
         # Handle tool use loop
-        while response.stop_reason == "tool_use":
-            # Process tool calls
-            tool_results = []
-            assistant_content = response.content
-
-            for block in response.content:
-                if block.type == "tool_use":
-                    console.print(f"[dim]Fetching {block.name}...[/dim]")
-
-                    result = execute_tool(block.name, block.input)
-                    tool_results.append({
-                        "type": "tool_result",
-                        "tool_use_id": block.id,
-                        "content": json.dumps(result, default=str),
-                    })
-
-            # Add assistant message with tool use
-            self.messages.append({
-                "role": "assistant",
-                "content": assistant_content,
-            })
-
-            # Add tool results
-            self.messages.append({
-                "role": "user",
-                "content": tool_results,
-            })
-
-            # Continue conversation
-            response = self._call_api()
-
-        # Extract text response
-        response_text = ""
-        for block in response.content:
-            if hasattr(block, "text"):
-                response_text += block.text
+        while True:
+            response, prefix = self._call_api(), ""
+            if response.stop_reason == "max_tokens":
+                # Cut off by the sized budget; continue the turn once at the full budget
+                prefix = _response_text(response).rstrip()
+                response = self._call_api(prefix)
+
+            if response.stop_reason != "tool_use":
+                break
+
+            self._handle_tool_use(response, out, prefix)
+
+        return self._finish_response(response, prefix)
+
+    def chat_stream(self, user_message: str, out: Console = console) -> Iterator[str]:
+        """Send a message and yield response text as it streams, handling tool use.
+
+        Tool progress is printed on out; pass the console of an active Live
+        display so the two don't fight over the terminal.
+        """
+
+        self._add_user_message(user_message)
+
+        while True:
+            response, prefix = (yield from self._stream_turn()), ""
+            if response.stop_reason == "max_tokens":
+                # The text so far has been shown; continue from it at the full budget
+                prefix = _response_text(response).rstrip()
+                response = yield from self._stream_turn(prefix)
+
+            if response.stop_reason != "tool_use":
+                break
+
+            self._handle_tool_use(response, out, prefix)
+
+        self._finish_response(response, prefix)
+
+    def _stream_turn(self, prefix: Optional[str] = None):
+        """Yield one assistant turn's text as it streams and return the final message."""
+        with self._stream_api(prefix) as stream:
+            yield from stream.text_stream
+            response = stream.get_final_message()
+        self._record_usage(response)
+        return response
+
+    def _add_user_message(self, user_message: str):
+        """Add a user turn to history and note whether it asks for long output."""
+        self._long_output = bool(LONG_OUTPUT_RE.search(user_message))
+        self.messages.append({"role": "user", "content": with_report_template(user_message)})
+
+    def _handle_tool_use(self, response, out: Console, prefix: str = ""):
+        """Execute the tool calls in a response and append them to history."""
+        calls = [block for block in response.content if block.type == "tool_use"]
+        self._record_tool_use(response, calls, self._execute_tools(calls, out), prefix)
+
+    def _record_tool_use(self, response, calls: list, results: dict, prefix: str = ""):
+        """Append an assistant tool_use turn and its results to history.
+
+        prefix is the text of a cut-off attempt that response continues.
+        """
+        assistant_content = list(response.content)
+        if prefix:
+            assistant_content.insert(0, {"type": "text", "text": prefix})
+
+        # Results must be returned in the same order as the tool_use blocks
+        tool_results = [
+            {
+                "type": "tool_result",
+                "tool_use_id": block.id,
+                "content": dumps_json(results[block.id]),
+            }
+            for block in calls
+        ]
+
+        # Add assistant message with tool use
+        self.messages.append({
+            "role": "assistant",
+            "content": assistant_content,
+        })
+
+        # Add tool results
+        self.messages.append({
+            "role": "user",
+            "content": tool_results,
+        })
+
+    def _finish_response(self, response, prefix: str = "") -> str:
+        """Extract the final text response and add it to history."""
+        if response.stop_reason == "max_tokens" and any(block.type == "tool_use" for block in response.content):
+            raise RuntimeError("Response hit the output token limit in the middle of a tool call")
+
+        response_text = prefix + _response_text(response)
 
         # Add assistant response to history
         self.messages.append({"role": "assistant", "content": response_text})
 
         return response_text
 
-    def _call_api(self):
+    def _execute_tools(self, calls: list, out: Console) -> dict:
+        """Execute tool calls concurrently, returning results keyed by tool_use id."""
+        results = {}
+        if not calls:
+            return results
+
+        # Fall back to sequential execution if any call is not concurrency-safe
+        if len(calls) == 1 or any(block.name in SEQUENTIAL_TOOLS for block in calls):
+            for block in calls:
+                out.print(f"[dim]Fetching {block.name}...[/dim]")
+                # Same error handling as the concurrent path, so batching never decides
+                # whether a failing call aborts the turn
+                try:
+                    results[block.id] = execute_tool(block.name, block.input)
+                except Exception as e:
+                    results[block.id] = {"error": str(e)}
+            return results
+
+        with ThreadPoolExecutor(max_workers=min(MAX_TOOL_WORKERS, len(calls))) as pool:
+            futures = {
+                pool.submit(execute_tool, block.name, block.input): block
+                for block in calls
+            }
+            for future in as_completed(futures):
+                block = futures[future]
+                out.print(f"[dim]Fetched {block.name}[/dim]")
+                try:
+                    results[block.id] = future.result()
+                except Exception as e:
+                    results[block.id] = {"error": str(e)}
+
+        return results
+
+    def _request_params(self, prefix: Optional[str] = None) -> dict:
+        """Build the parameters shared by every API call.
+
+        A prefix (possibly empty) marks a retry of a turn cut off at max_tokens:
+        it runs at the full budget, with the prefix text prefilled so the model
+        continues where it stopped.
+        """
+        messages = _with_cache_breakpoint(self.messages)
+        if prefix:
+            messages = messages + [{"role": "assistant", "content": prefix}]
+        return {
+            "model": self.model,
+            "max_tokens": MAX_OUTPUT_TOKENS if prefix is not None else self._max_tokens(),
+            "system": self.system_prompt,
+            "tools": TOOLS,
+            "messages": messages,
+        }
+
+    def _compact_history(self):
+        """Truncate tool results older than the last `max_history_turns` user turns.
+
+        Only tool_result bodies are shortened, so every tool_use block keeps its
+        matching tool_result. Shortening edits the prompt prefix that the cache
+        breakpoint reuses, so it waits until the window is overrun by
+        COMPACT_BATCH_TURNS turns and then trims back to `max_history_turns`;
+        between batches the cached prefix stays valid.
+        """
+        turn_starts = [
+            i for i, m in enumerate(self.messages)
+            if m["role"] == "user" and isinstance(m["content"], str)
+        ]
+        uncompacted = sum(1 for i in turn_starts if i >= self._compacted_until)
+        if uncompacted <= self.max_history_turns + COMPACT_BATCH_TURNS:
+            return
+
+        cutoff = turn_starts[-self.max_history_turns]
+        for message in self.messages[self._compacted_until:cutoff]:
+            if message["role"] != "user" or isinstance(message["content"], str):
+                continue
+            for block in message["content"]:
+                content = block.get("content")
+                if (
+                    block.get("type") == "tool_result"
+                    and isinstance(content, str)
+                    and not content.startswith("[summarized: ")
+                ):
+                    block["content"] = f"[summarized: {content[:SUMMARY_CHARS]}]"
+        self._compacted_until = cutoff
+
+    def _max_tokens(self) -> int:
+        """Size the output budget from recent response lengths."""
+        if self._long_output:
+            return MAX_OUTPUT_TOKENS
+        return max(MIN_OUTPUT_TOKENS, min(MAX_OUTPUT_TOKENS, int(2 * self._ema_out_tokens + 256)))
+
+    def _record_usage(self, response):
+        """Update the moving average of output tokens from final answers.
+
+        Short tool_use turns and cut-off turns would drag the budget for the
+        answer itself down, so they are not counted.
+        """
+        if response.stop_reason in ("tool_use", "max_tokens"):
+            return
+        usage = getattr(response, "usage", None)
+        if usage is not None:
+            self._ema_out_tokens = 0.7 * self._ema_out_tokens + 0.3 * usage.output_tokens
+
+    def _call_api(self, prefix: Optional[str] = None):
         """Make an API call to Claude."""
-        return self.client.messages.create(
-            model=self.model,
-            max_tokens=4096,
-            system=self.system_prompt,
-            tools=TOOLS,
-            messages=self.messages,
-        )
+        self._compact_history()
+        response = self.client.messages.create(**self._request_params(prefix))
+        self._record_usage(response)
+        return response
 
+    def _stream_api(self, prefix: Optional[str] = None):
+        """Open a streaming API call to Claude."""
+        self._compact_history()
+        return self.client.messages.stream(**self._request_params(prefix))
 
-def run_chat_loop(agent: CTOAgent):
-    """Run the interactive chat loop in fullscreen alternate screen mode (like vim/nano)."""
-    import curses
-    import io
-    import sys
-    from contextlib import redirect_stdout, redirect_stderr
 
-    def _main_loop(stdscr):
-        """Main curses loop - runs in alternate screen."""
-        # Exit curses mode temporarily to use Rich for display
-        curses.endwin()
+def _response_text(response) -> str:
+    """Concatenate the text blocks of a response."""
+    return "".join(block.text for block in response.content if block.type == "text")
 
-        # Now we're in the alternate screen but can use normal terminal I/O
-        alt_console = Console()
-
-        def _draw_header(message: str = None):
-            """Draw the header panel."""
-            alt_console.clear()
-            alt_console.print()
-            alt_console.print(Panel(
-                "[bold cyan]CTO Agent[/bold cyan]\n"
-                f"[dim]{message or 'Ask me about your work, request reports, or get insights.'}[/dim]\n"
-                "[dim]Type 'exit' to end, 'clear' for new conversation, 'help' for commands.[/dim]",
-                box=box.ROUNDED,
-                width=min(80, alt_console.width),
-            ), justify="center")
-            alt_console.print()
-
-        _draw_header()
 
-        while True:
-            try:
-                # Get user input
-                user_input = alt_console.input("[bold green]You:[/bold green] ").strip()
+def _with_cache_breakpoint(messages: list[dict]) -> list[dict]:
+    """Mark the last message so the conversation so far is served from the prompt cache next turn."""
+    if not messages:
+        return messages
 
-                if not user_input:
-                    continue
+    last = messages[-1]
+    content = last["content"]
+    blocks = [{"type": "text", "text": content}] if isinstance(content, str) else list(content)
+    if not blocks or not isinstance(blocks[-1], dict):
+        return messages
 
-                # Handle special commands
-                if user_input.lower() in ("exit", "quit", "q"):
-                    break
+    blocks[-1] = {**blocks[-1], "cache_control": {"type": "ephemeral"}}
+    return messages[:-1] + [{**last, "content": blocks}]
 
-                if user_input.lower() == "help":
-                    _show_help_alt(alt_console)
-                    continue
 
-                if user_input.lower() == "clear":
-                    agent.clear_history()
-                    _draw_header("New conversation started.")
-                    continue
+def run_chat_loop(agent: CTOAgent, fullscreen: bool = True):
+    """Run the interactive chat loop, by default in fullscreen alternate screen mode (like vim/nano)."""
+    if not fullscreen:
+        _chat_loop(agent, console, fullscreen=False)
+        return
 
-                # Get response from agent
-                with alt_console.status("[bold blue]Thinking...[/bold blue]"):
-                    response = agent.chat(user_input)
+    # curses is imported lazily since it is unavailable on Windows
+    import curses
 
-                # Display response
-                alt_console.print()
-                alt_console.print("[bold blue]CTO Agent:[/bold blue]")
-                alt_console.print(Markdown(response))
-                alt_console.print()
+    def _main_loop(stdscr):
+        """Main curses loop - runs in alternate screen."""
+        # Exit curses mode temporarily to use Rich for display
+        curses.endwin()
 
-            except KeyboardInterrupt:
-                alt_console.print("\n[dim]Interrupted. Type 'exit' to quit.[/dim]")
-            except Exception as e:
-                alt_console.print(f"[red]Error: {e}[/red]")
+        # Now we're in the alternate screen but can use normal terminal I/O
+        _chat_loop(agent, Console(), fullscreen=True)
 
     # Use curses.wrapper to handle alternate screen setup/teardown
     curses.wrapper(_main_loop)
 
 
-def _show_help_alt(alt_console):
-    """Display help information in alternate screen."""
-    help_text = """
-## Commands
-- `exit` / `quit` - End the conversation
-- `clear` - Start a new conversation
-- `help` - Show this help
-
-## Example Questions
-- "What did I work on today?"
-- "Generate my standup notes"
-- "Create a weekly report"
-- "How many commits did I make this week?"
-- "What meetings do I have today?"
-- "Summarize my browser research this week"
-"""
-    alt_console.print(Markdown(help_text))
-
-
-def _show_help():
+def _chat_loop(agent: CTOAgent, chat_console: Console, fullscreen: bool):
+    """Read user input and display agent responses until the user exits."""
+
+    def _draw_header(message: str = None):
+        """Draw the header panel."""
+        if fullscreen:
+            chat_console.clear()
+        chat_console.print()
+        chat_console.print(Panel(
+            "[bold cyan]CTO Agent[/bold cyan]\n"
+            f"[dim]{message or 'Ask me about your work, request reports, or get insights.'}[/dim]\n"
+            "[dim]Type 'exit' to end, 'clear' for new conversation, 'help' for commands.[/dim]",
+            box=box.ROUNDED,
+            width=min(80, chat_console.width),
+        ), justify="center")
+        chat_console.print()
+
+    _draw_header()
+
+    while True:
+        try:
+            # Get user input
+            user_input = chat_console.input("[bold green]You:[/bold green] ").strip()
+
+            if not user_input:
+                continue
+
+            # Handle special commands
+            if user_input.lower() in ("exit", "quit", "q"):
+                break
+
+            if user_input.lower() == "help":
+                _show_help(chat_console)
+                continue
+
+            if user_input.lower() == "clear":
+                agent.clear_history()
+                _draw_header("New conversation started.")
+                continue
+
+            # Stream response from agent, re-rendering markdown as chunks arrive
+            chat_console.print()
+            chat_console.print("[bold blue]CTO Agent:[/bold blue]")
+            response = ""
+            rendered_at = 0.0
+            with Live(Markdown(response), console=chat_console, refresh_per_second=LIVE_REFRESH_PER_SECOND) as live:
+                # Tool progress goes through the Live's console so it prints above the render
+                for chunk in agent.chat_stream(user_input, live.console):
+                    response += chunk
+                    # Parsing is linear in the response so far; doing it per delta would be quadratic
+                    now = time.monotonic()
+                    if now - rendered_at >= 1 / LIVE_REFRESH_PER_SECOND:
+                        live.update(Markdown(response))
+                        rendered_at = now
+                live.update(Markdown(response))
+            chat_console.print()
+
+        except KeyboardInterrupt:
+            chat_console.print("\n[dim]Interrupted. Type 'exit' to quit.[/dim]")
+        except Exception as e:
+            chat_console.print(f"[red]Error: {e}[/red]")
+
+
+def _show_help(target_console: Console):
     """Display help information."""
     help_text = """
 ## Commands
@@ -212,4 +408,4 @@ def _show_help():
 - "What meetings do I have today?"
 - "Summarize my browser research this week"
 """
-    console.print(Markdown(help_text))
+    target_console.print(Markdown(help_text))
@@ -3,15 +3,16 @@ Tool definitions for Claude to fetch work data.
 Uses Anthropic's tool_use feature.
 """
 
-import sys
-from datetime import datetime
-from pathlib import Path
-from typing import Any
-
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import json
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from datetime import date, datetime, time as dt_time
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Iterable
 
 from sources import (
+    clear_chrome_cache,
     get_chrome_history,
     get_github_commits,
     get_calendar_events,
@@ -20,34 +21,45 @@ from sources import (
     get_linear_audit_logs,
 )
 from config import load_config
+from mcp.linear import get_linear_server
+
+# Last second of a day, matching the ranges the sources were written against
+_END_OF_DAY = dt_time(23, 59, 59)
+
+# Characters the serialized tool schemas may take; they are sent with every API
+# call. Four tools' input schemas alone exceed the 800 first aimed for, so this
+# sits just above the trimmed size to catch descriptions growing back
+TOOLS_MAX_CHARS = 1700
+
+# Seconds fetched source data is reused for identical or overlapping requests
+WORK_CACHE_TTL = 60
+
+# (source, start, end) -> (fetched_at, raw source data); shared by every call,
+# so results are built from new objects and never modify the cached rows
+_SOURCE_CACHE: dict[tuple, tuple[float, Any]] = {}
+
+# Shared by every tool call so repeated fetches in a chat reuse warm threads;
+# workers start on first submit and are joined at interpreter exit
+_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="worklog-tools")
 
 
 # Tool schema definitions for Claude
 TOOLS = [
     {
         "name": "get_work_data",
-        "description": """Fetch work activity data from multiple sources for a specific date range.
-Returns calendar events, browser history, GitHub commits, Slack messages, and Linear activity.
-Use this tool when you need to analyze the user's work activities, generate reports,
-or answer questions about what they worked on.""",
+        "description": "Fetch calendar/browser/github/slack/linear activity between two dates. Request all needed sources in one call.",
         "input_schema": {
             "type": "object",
             "properties": {
-                "start_date": {
-                    "type": "string",
-                    "description": "Start date in YYYY-MM-DD format"
-                },
-                "end_date": {
-                    "type": "string",
-                    "description": "End date in YYYY-MM-DD format"
-                },
+                "start_date": {"type": "string", "description": "YYYY-MM-DD"},
+                "end_date": {"type": "string", "description": "YYYY-MM-DD"},
                 "sources": {
                     "type": "array",
                     "items": {
                         "type": "string",
                         "enum": ["calendar", "browser", "github", "slack", "linear"]
                     },
-                    "description": "Which data sources to fetch. Defaults to all if not specified."
+                    "description": "Defaults to all"
                 }
             },
             "required": ["start_date", "end_date"]
@@ -55,76 +67,84 @@ or answer questions about what they worked on.""",
     },
     {
         "name": "get_current_date",
-        "description": "Get the current date and time. Use this to understand temporal references like 'today', 'yesterday', 'this week'.",
-        "input_schema": {
-            "type": "object",
-            "properties": {},
-            "required": []
-        }
+        "description": "Get the current date, time and week number.",
+        "input_schema": {"type": "object", "properties": {}}
     },
     {
         "name": "query_linear",
-        "description": """Query Linear workspace for issues, projects, teams, or audit logs.
-Use this for questions about Linear workspace data, project status, team members, or security audit logs.""",
+        "description": "Query Linear issues, projects, teams or audit logs. Prefer query_linear_multi for more than one query.",
         "input_schema": {
             "type": "object",
             "properties": {
                 "query_type": {
                     "type": "string",
-                    "enum": ["my_issues", "search_issues", "projects", "teams", "audit_logs"],
-                    "description": "Type of query to run"
-                },
-                "search_text": {
-                    "type": "string",
-                    "description": "Search text (for search_issues query type)"
+                    "enum": ["my_issues", "search_issues", "projects", "teams", "audit_logs"]
                 },
-                "team_key": {
-                    "type": "string",
-                    "description": "Team key to filter by (e.g., 'ENG')"
-                },
-                "state": {
-                    "type": "string",
-                    "description": "Issue state filter (e.g., 'started', 'completed')"
-                },
-                "start_date": {
-                    "type": "string",
-                    "description": "Start date for audit logs (YYYY-MM-DD)"
-                },
-                "end_date": {
-                    "type": "string",
-                    "description": "End date for audit logs (YYYY-MM-DD)"
-                }
+                "search_text": {"type": "string", "description": "For search_issues"},
+                "team_key": {"type": "string", "description": "e.g. ENG"},
+                "state": {"type": "string", "description": "e.g. started, completed"},
+                "start_date": {"type": "string", "description": "Audit logs, YYYY-MM-DD"},
+                "end_date": {"type": "string", "description": "Audit logs, YYYY-MM-DD"}
             },
             "required": ["query_type"]
         }
+    },
+    {
+        "name": "query_linear_multi",
+        "description": "Run several query_linear queries concurrently; results keep request order.",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "queries": {
+                    "type": "array",
+                    "items": {"type": "object", "description": "query_linear input"}
+                }
+            },
+            "required": ["queries"]
+        }
     }
 ]
 
+assert len(json.dumps(TOOLS)) < TOOLS_MAX_CHARS, "tool schemas exceed TOOLS_MAX_CHARS; trim the descriptions"
+
+# Cache breakpoint on the last tool so the whole tool schema is served from the prompt cache
+TOOLS[-1]["cache_control"] = {"type": "ephemeral"}
+
 
 def execute_tool(tool_name: str, tool_input: dict) -> dict[str, Any]:
     """Execute a tool and return the result."""
+    handler = _DISPATCH.get(tool_name)
+    if handler is None:
+        return {"error": f"Unknown tool: {tool_name}"}
+    return handler(tool_input)
+
+
+def _get_current_date(tool_input: dict) -> dict:
+    """Return the current date and time."""
+    now = datetime.now()
+    current_date, day_of_week, week_number = _describe_day(now.toordinal())
+    return {
+        "current_date": current_date,
+        "current_time": now.strftime("%H:%M:%S"),
+        "day_of_week": day_of_week,
+        "week_number": week_number,
+    }
 
-    if tool_name == "get_current_date":
-        now = datetime.now()
-        return {
-            "current_date": now.strftime("%Y-%m-%d"),
-            "current_time": now.strftime("%H:%M:%S"),
-            "day_of_week": now.strftime("%A"),
-            "week_number": now.isocalendar()[1],
-        }
 
-    elif tool_name == "get_work_data":
-        return _fetch_work_data(
-            tool_input["start_date"],
-            tool_input["end_date"],
-            tool_input.get("sources", ["calendar", "browser", "github", "slack", "linear"])
-        )
+@lru_cache(maxsize=1)
+def _describe_day(ordinal: int) -> tuple[str, str, int]:
+    """Date string, weekday name and ISO week for a day, computed once per day."""
+    day = date.fromordinal(ordinal)
+    return day.isoformat(), day.strftime("%A"), day.isocalendar()[1]
 
-    elif tool_name == "query_linear":
-        return _query_linear(tool_input)
 
-    else:
-        return {"error": f"Unknown tool: {tool_name}"}
+def _get_work_data(tool_input: dict) -> dict:
+    """Unpack get_work_data tool input."""
+    return _fetch_work_data(
+        tool_input["start_date"],
+        tool_input["end_date"],
+        tool_input.get("sources", ["calendar", "browser", "github", "slack", "linear"])
+    )
 
 
 def _fetch_work_data(start_date: str, end_date: str, sources: list[str]) -> dict:
@@ -132,10 +152,8 @@ def _fetch_work_data(start_date: str, end_date: str, sources: list[str]) -> dict
     config = load_config()
 
     # Parse dates
-    start = datetime.strptime(start_date, "%Y-%m-%d")
-    start = start.replace(hour=0, minute=0, second=0)
-    end = datetime.strptime(end_date, "%Y-%m-%d")
-    end = end.replace(hour=23, minute=59, second=59)
+    start = datetime.combine(date.fromisoformat(start_date), dt_time.min)
+    end = datetime.combine(date.fromisoformat(end_date), _END_OF_DAY)
 
     result = {
         "date_range": {
@@ -145,62 +163,74 @@ def _fetch_work_data(start_date: str, end_date: str, sources: list[str]) -> dict
         "data": {}
     }
 
-    # Fetch calendar events
-    if "calendar" in sources:
+    # Kick off all source fetches concurrently; each is a blocking network/DB call
+    fetchers = {
+        "calendar": lambda: get_calendar_events(config, start, end),
+        "browser": lambda: get_chrome_history(start, end, config.get("chrome_profile")),
+        "github": lambda: get_github_commits(config, start, end),
+        "slack": lambda: get_slack_messages(config, start, end),
+        "linear": lambda: get_linear_activity(config, start, end),
+    }
+    requested = [name for name in fetchers if name in sources]
+    if not requested:
+        return result
+
+    # Reuse raw source data fetched recently for the same range
+    now = time.monotonic()
+    jobs = {}
+    for name in requested:
+        hit = _SOURCE_CACHE.get((name, start, end))
+        if hit and now - hit[0] < WORK_CACHE_TTL:
+            jobs[name] = Future()
+            jobs[name].set_result(hit[1])
+    missing = [name for name in requested if name not in jobs]
+
+    if missing:
+        fetched = {name: _EXECUTOR.submit(fetchers[name]) for name in missing}
+        wait(fetched.values())
+        for name, future in fetched.items():
+            if future.exception() is None:
+                _SOURCE_CACHE[(name, start, end)] = (now, future.result())
+        jobs.update(fetched)
+
+    # Post-process results on the main thread, preserving per-source error isolation
+    if "calendar" in jobs:
         try:
-            events = get_calendar_events(config, start, end)
-            result["data"]["calendar_events"] = events
+            result["data"]["calendar_events"] = [dict(event) for event in jobs["calendar"].result()]
         except Exception as e:
             result["data"]["calendar_events"] = {"error": str(e)}
 
-    # Fetch browser history
-    if "browser" in sources:
+    if "browser" in jobs:
         try:
-            history = get_chrome_history(start, end, config.get("chrome_profile"))
+            history = jobs["browser"].result()
             # Deduplicate and limit to prevent token overflow
-            seen = set()
-            unique_history = []
+            unique_history = {}
             for item in history:
-                key = item["title"].lower()
-                if key not in seen:
-                    seen.add(key)
-                    unique_history.append({
-                        "title": item["title"],
-                        "url": item["url"],
-                        "time": item["time"],
-                    })
-                    if len(unique_history) >= 50:  # Limit results
-                        break
-            result["data"]["browser_history"] = unique_history
+                key = item["title"].casefold()
+                if unique_history.setdefault(key, item) is not item:
+                    continue
+                if len(unique_history) == 50:  # Limit results
+                    break
+            result["data"]["browser_history"] = _project(unique_history.values(), ("title", "url", "time"))
             result["data"]["browser_history_total"] = len(history)
         except Exception as e:
             result["data"]["browser_history"] = {"error": str(e)}
 
-    # Fetch GitHub commits
-    if "github" in sources:
+    if "github" in jobs:
         try:
-            commits = get_github_commits(config, start, end)
-            result["data"]["github_commits"] = [
-                {
-                    "repo": c["repo"],
-                    "message": c["message"],
-                    "time": c["time"],
-                    "changes": c["changes"],
-                }
-                for c in commits
-            ]
+            commits = jobs["github"].result()
+            result["data"]["github_commits"] = _project(commits, ("repo", "message", "time", "changes"))
         except Exception as e:
             result["data"]["github_commits"] = {"error": str(e)}
 
-    # Fetch Slack messages
-    if "slack" in sources:
+    if "slack" in jobs:
         try:
-            messages = get_slack_messages(config, start, end)
+            messages = jobs["slack"].result()
             # Limit and format messages
             result["data"]["slack_messages"] = [
                 {
                     "channel": m["channel"],
-                    "text": m["text"][:200] + "..." if len(m["text"]) > 200 else m["text"],
+                    "text": m["text"] if len(m["text"]) <= 200 else f"{m['text'][:200]}...",
                     "time": m["time"],
                 }
                 for m in messages[:50]  # Limit to 50 messages
@@ -209,20 +239,13 @@ def _fetch_work_data(start_date: str, end_date: str, sources: list[str]) -> dict
         except Exception as e:
             result["data"]["slack_messages"] = {"error": str(e)}
 
-    # Fetch Linear activity
-    if "linear" in sources:
+    if "linear" in jobs:
         try:
-            activity = get_linear_activity(config, start, end)
-            result["data"]["linear_activity"] = [
-                {
-                    "id": a["id"],
-                    "title": a["title"],
-                    "state": a["state"],
-                    "team": a["team"],
-                    "time": a["time"],
-                }
-                for a in activity[:30]  # Limit results
-            ]
+            activity = jobs["linear"].result()
+            result["data"]["linear_activity"] = _project(
+                activity[:30],  # Limit results
+                ("id", "title", "state", "team", "time"),
+            )
             result["data"]["linear_activity_total"] = len(activity)
         except Exception as e:
             result["data"]["linear_activity"] = {"error": str(e)}
@@ -230,10 +253,20 @@ def _fetch_work_data(start_date: str, end_date: str, sources: list[str]) -> dict
     return result
 
 
+def clear_cache():
+    """Drop all cached work data, including the local copy of Chrome history."""
+    _SOURCE_CACHE.clear()
+    clear_chrome_cache()
+
+
+def _project(rows: Iterable[dict], keys: tuple[str, ...]) -> list[dict]:
+    """Select a subset of keys from each row."""
+    getter = itemgetter(*keys)
+    return [dict(zip(keys, getter(row))) for row in rows]
+
+
 def _query_linear(tool_input: dict) -> dict:
     """Query Linear workspace data."""
-    from mcp.linear import LinearMCPServer
-
     config = load_config()
     api_key = config.get("linear_api_key")
 
@@ -241,7 +274,7 @@ def _query_linear(tool_input: dict) -> dict:
         return {"error": "Linear API key not configured. Run 'cto setup' first."}
 
     try:
-        server = LinearMCPServer(api_key)
+        server = get_linear_server(api_key)
         query_type = tool_input.get("query_type")
 
         if query_type == "my_issues":
@@ -269,8 +302,8 @@ def _query_linear(tool_input: dict) -> dict:
             start_date = tool_input.get("start_date")
             end_date = tool_input.get("end_date")
 
-            start = datetime.strptime(start_date, "%Y-%m-%d") if start_date else None
-            end = datetime.strptime(end_date, "%Y-%m-%d") if end_date else None
+            start = datetime.fromisoformat(start_date) if start_date else None
+            end = datetime.fromisoformat(end_date) if end_date else None
 
             logs = server.get_audit_logs(start_date=start, end_date=end)
             return {"audit_logs": logs, "count": len(logs)}
@@ -280,3 +313,24 @@ def _query_linear(tool_input: dict) -> dict:
 
     except Exception as e:
         return {"error": str(e)}
+
+
+
+def _query_linear_multi(tool_input: dict) -> dict:
+    """Run several Linear queries concurrently, preserving request order."""
+    queries = tool_input.get("queries") or []
+    if not queries:
+        return {"results": []}
+
+    results = list(_EXECUTOR.map(_query_linear, queries))
+
+    return {"results": results}
+
+
+# Tool name -> handler taking the raw tool input
+_DISPATCH = {
+    "get_current_date": _get_current_date,
+    "get_work_data": _get_work_data,
+    "query_linear": _query_linear,
+    "query_linear_multi": _query_linear_multi,
+}
@@ -1,18 +1,30 @@
 """
 Command handlers for Worklog CLI.
+
+Handlers are imported on first access so each invocation only loads the
+modules its command needs.
 """
 
-from commands.summary import cmd_summary, cmd_day, cmd_week, cmd_month
-from commands.chat import cmd_chat
-from commands.setup import cmd_setup
-from commands.projects import cmd_projects
+import importlib
+
+# Handler name -> module that defines it
+_COMMANDS = {
+    "cmd_summary": "commands.summary",
+    "cmd_day": "commands.summary",
+    "cmd_week": "commands.summary",
+    "cmd_month": "commands.summary",
+    "cmd_chat": "commands.chat",
+    "cmd_setup": "commands.setup",
+    "cmd_projects": "commands.projects",
+}
+
+__all__ = list(_COMMANDS)
+
 
-__all__ = [
-    "cmd_summary",
-    "cmd_day",
-    "cmd_week",
-    "cmd_month",
-    "cmd_chat",
-    "cmd_setup",
-    "cmd_projects",
-]
+def __getattr__(name: str):
+    module = _COMMANDS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    handler = getattr(importlib.import_module(module), name)
+    globals()[name] = handler
+    return handler
@@ -41,4 +41,4 @@ def cmd_chat(args):
         return
 
     # Run interactive loop
-    run_chat_loop(agent)
+    run_chat_loop(agent, fullscreen=args.fullscreen)
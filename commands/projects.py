@@ -3,19 +3,16 @@ Projects command handler for Worklog CLI.
 Displays Linear projects grouped by status, sorted by last status/health update.
 """
 
-import sys
-from datetime import datetime
-from pathlib import Path
+from datetime import datetime, timezone
+from functools import lru_cache
+from operator import itemgetter
 
 from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich import box
-
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from rich.text import Text
 
 from config import load_config
+from utils.cache import cache_get, cache_set
+from utils.dates import parse_iso_datetime
 
 console = Console()
 
@@ -26,9 +23,27 @@ HEALTH_CONFIG = {
     "offTrack": {"icon": "🔴", "color": "red", "label": "Off Track"},
 }
 
+# Health cells rendered once; None covers projects without a health value
+HEALTH_RENDERED = {
+    health: f"{cfg['icon']} [{cfg['color']}]{cfg['label']}[/{cfg['color']}]"
+    for health, cfg in HEALTH_CONFIG.items()
+}
+HEALTH_RENDERED[None] = "[dim]-[/dim]"
+
+# Pre-parsed cells so Rich doesn't re-parse the same markup on every row
+HEALTH_CELLS = {health: Text.from_markup(markup) for health, markup in HEALTH_RENDERED.items()}
+_DASH = Text("-")
+
+# Seconds a cached projects response stays fresh
+PROJECTS_CACHE_TTL = 60
+
 
 def cmd_projects(args):
     """Display Linear projects grouped by status, sorted by last status update."""
+    from rich import box
+    from rich.panel import Panel
+    from rich.table import Table
+
     config = load_config()
     api_key = config.get("linear_api_key")
 
@@ -37,11 +52,16 @@ def cmd_projects(args):
         console.print("Run 'cto setup' to add your Linear API key.")
         return
 
-    from mcp.linear import LinearMCPServer
+    from mcp.linear import get_linear_server
 
     try:
-        server = LinearMCPServer(api_key)
-        projects = server.get_projects(include_completed=args.all if hasattr(args, 'all') else False)
+        server = get_linear_server(api_key)
+        projects = _cached_get_projects(
+            server,
+            api_key,
+            include_completed=args.all if hasattr(args, 'all') else False,
+            use_cache=not getattr(args, "no_cache", False),
+        )
     except Exception as e:
         console.print(f"[red]Error fetching projects: {e}[/red]")
         return
@@ -60,19 +80,17 @@ def cmd_projects(args):
         "canceled": [],     # Canceled
     }
 
+    # Bucket (sort_key, project) pairs in one pass; the key is the last health
+    # update, falling back to the last status update
     for project in projects:
         state = (project.get("state") or "backlog").lower()
-        if state in status_groups:
-            status_groups[state].append(project)
-        else:
-            status_groups["backlog"].append(project)
-
-    # Sort each group by health_updated_at (most recent first), fallback to status_updated_at
-    for state in status_groups:
-        status_groups[state].sort(
-            key=lambda p: p.get("health_updated_at") or p.get("status_updated_at") or p.get("updated_at") or "",
-            reverse=True
-        )
+        sort_key = project.get("health_updated_at") or project.get("status_updated_at") or project.get("updated_at") or ""
+        status_groups.get(state, status_groups["backlog"]).append((sort_key, project))
+
+    # Sort each group most recent first, then drop the keys
+    for state, bucket in status_groups.items():
+        bucket.sort(key=itemgetter(0), reverse=True)
+        status_groups[state] = [project for _, project in bucket]
 
     # Display header
     console.print()
@@ -100,6 +118,11 @@ def cmd_projects(args):
 
     total_projects = 0
 
+    # Capture the current time once for overdue checks and relative timestamps
+    now_naive = datetime.now()
+    now_utc = datetime.now(timezone.utc)
+    today = now_naive.date()
+
     for state in display_order:
         projects_in_state = status_groups.get(state, [])
         if not projects_in_state:
@@ -124,15 +147,11 @@ def cmd_projects(args):
         table.add_column("Target", style="green", width=12)
         table.add_column("Health Update", style="dim", width=14)
 
+        rows = []
         for project in projects_in_state:
             # Format health - prefer latest_health from project updates
-            health = project.get("latest_health") or project.get("health")
-
-            if health:
-                health_cfg = HEALTH_CONFIG.get(health, {"icon": "⚪", "color": "dim", "label": health})
-                health_str = f"{health_cfg['icon']} [{health_cfg['color']}]{health_cfg['label']}[/{health_cfg['color']}]"
-            else:
-                health_str = "[dim]-[/dim]"
+            health = project.get("latest_health") or project.get("health") or None
+            health_cell = HEALTH_CELLS.get(health) or Text.from_markup(f"⚪ [dim]{health}[/dim]")
 
             # Format progress
             progress = project.get("progress")
@@ -146,35 +165,37 @@ def cmd_projects(args):
             target = project.get("target_date")
             if target:
                 try:
-                    target_dt = datetime.fromisoformat(target.replace("Z", "+00:00"))
-                    target_str = target_dt.strftime("%Y-%m-%d")
+                    target_dt = parse_iso_datetime(target)
                     # Highlight overdue
-                    if target_dt.date() < datetime.now().date() and state != "completed":
-                        target_str = f"[red]{target_str}[/red]"
+                    overdue = target_dt.date() < today and state != "completed"
+                    target_cell = Text(target_dt.strftime("%Y-%m-%d"), style="red" if overdue else "")
                 except Exception:
-                    target_str = target[:10] if len(target) >= 10 else target
+                    target_cell = Text(target[:10])
             else:
-                target_str = "-"
+                target_cell = _DASH
 
             # Format health_updated_at
             health_updated = project.get("health_updated_at") or project.get("status_updated_at")
             if health_updated:
                 try:
-                    updated_dt = datetime.fromisoformat(health_updated.replace("Z", "+00:00"))
-                    updated_str = _relative_time(updated_dt)
+                    updated_dt = parse_iso_datetime(health_updated)
+                    updated_str = _relative_time(updated_dt, now_utc if updated_dt.tzinfo else now_naive)
                 except Exception:
-                    updated_str = health_updated[:10] if len(health_updated) >= 10 else health_updated
+                    updated_str = health_updated[:10]
             else:
                 updated_str = "-"
 
-            table.add_row(
-                project.get("name", "Untitled"),
-                health_str,
+            rows.append((
+                Text(project.get("name", "Untitled")),
+                health_cell,
                 progress_str,
-                project.get("lead") or "-",
-                target_str,
+                Text(project.get("lead") or "-"),
+                target_cell,
                 updated_str,
-            )
+            ))
+
+        for row in rows:
+            table.add_row(*row)
 
         console.print(table)
         console.print()
@@ -184,27 +205,47 @@ def cmd_projects(args):
     console.print()
 
 
-def _relative_time(dt: datetime) -> str:
+def _cached_get_projects(server, api_key: str, include_completed: bool, use_cache: bool = True, ttl: int = PROJECTS_CACHE_TTL) -> list[dict]:
+    """Fetch projects, reusing a short-lived on-disk copy of the last response."""
+    key = f"{api_key}:{include_completed}:table"
+    if use_cache:
+        cached = cache_get("projects", key)
+        if cached is not None:
+            return cached
+
+    projects = server.get_projects(include_completed=include_completed, profile="table")
+    cache_set("projects", key, projects, ttl)
+    return projects
+
+
+def _relative_time(dt: datetime, now: datetime = None) -> str:
     """Convert datetime to relative time string."""
-    now = datetime.now(dt.tzinfo) if dt.tzinfo else datetime.now()
+    if now is None:
+        now = datetime.now(dt.tzinfo) if dt.tzinfo else datetime.now()
     diff = now - dt
 
-    if diff.days == 0:
-        hours = diff.seconds // 3600
+    # Minutes only matter within the same day; dropping them otherwise keeps the cache small
+    return _format_delta(diff.days, diff.seconds // 60 if diff.days == 0 else 0)
+
+
+@lru_cache(maxsize=1024)
+def _format_delta(days: int, minutes: int) -> str:
+    """Format a day/minute offset as a relative time string."""
+    if days == 0:
+        hours = minutes // 60
         if hours == 0:
-            minutes = diff.seconds // 60
             return f"{minutes}m ago" if minutes > 0 else "just now"
         return f"{hours}h ago"
-    elif diff.days == 1:
+    elif days == 1:
         return "yesterday"
-    elif diff.days < 7:
-        return f"{diff.days}d ago"
-    elif diff.days < 30:
-        weeks = diff.days // 7
+    elif days < 7:
+        return f"{days}d ago"
+    elif days < 30:
+        weeks = days // 7
         return f"{weeks}w ago"
-    elif diff.days < 365:
-        months = diff.days // 30
+    elif days < 365:
+        months = days // 30
         return f"{months}mo ago"
     else:
-        years = diff.days // 365
+        years = days // 365
         return f"{years}y ago"
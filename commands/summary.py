@@ -3,43 +3,49 @@ Summary command handlers for Worklog CLI.
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 
 from rich.console import Console
 
 from config import load_config, is_configured
 from sources import get_calendar_events, get_chrome_history, get_github_commits
-from display import display_summary, display_range_summary
+from display import display_summary, display_range_summary, display_json
 from utils import parse_date, parse_week, parse_month, get_date_range, get_week_range, get_month_range
 
 console = Console()
-
-
-def fetch_data_for_range(config: dict, start: datetime, end: datetime) -> tuple[list, list, list]:
-    """Fetch all data sources for a date range."""
-    events = []
-    searches = []
-    commits = []
-
-    with console.status("[bold green]Fetching calendar events..."):
-        try:
-            events = get_calendar_events(config, start, end)
-        except Exception as e:
-            console.print(f"[yellow]Warning: Could not fetch calendar events: {e}[/yellow]")
-
-    with console.status("[bold blue]Reading Chrome history..."):
-        try:
-            searches = get_chrome_history(start, end, chrome_profile=config.get("chrome_profile"))
-        except Exception as e:
-            console.print(f"[yellow]Warning: Could not read Chrome history: {e}[/yellow]")
-
-    with console.status("[bold green]Fetching GitHub commits..."):
-        try:
-            commits = get_github_commits(config, start, end)
-        except Exception as e:
-            console.print(f"[yellow]Warning: Could not fetch GitHub commits: {e}[/yellow]")
-
-    return events, searches, commits
+# Progress and warnings go here in --json mode so stdout stays machine-readable
+err_console = Console(stderr=True)
+
+
+def fetch_data_for_range(
+    config: dict,
+    start: datetime,
+    end: datetime,
+    out: Console = console,
+    use_cache: bool = True,
+) -> tuple[list, list, list]:
+    """Fetch all data sources for a date range concurrently, reporting progress on out."""
+    results = {"events": [], "searches": [], "commits": []}
+
+    # Label -> (result key, warning prefix, fetcher)
+    sources = {
+        "calendar": ("events", "Could not fetch calendar events", lambda: get_calendar_events(config, start, end)),
+        "chrome": ("searches", "Could not read Chrome history", lambda: get_chrome_history(start, end, chrome_profile=config.get("chrome_profile"), use_cache=use_cache)),
+        "github": ("commits", "Could not fetch GitHub commits", lambda: get_github_commits(config, start, end)),
+    }
+
+    with out.status("[bold green]Fetching data..."):
+        with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+            futures = {executor.submit(fetch): label for label, (_, _, fetch) in sources.items()}
+            for future in as_completed(futures):
+                key, warning, _ = sources[futures[future]]
+                try:
+                    results[key] = future.result()
+                except Exception as e:
+                    out.print(f"[yellow]Warning: {warning}: {e}[/yellow]")
+
+    return results["events"], results["searches"], results["commits"]
 
 
 def cmd_summary(args):
@@ -63,11 +69,7 @@ def cmd_summary(args):
         date = datetime.now()
 
     start, end = get_date_range(date)
-
-    console.print(f"[dim]Fetching data for {date.strftime('%Y-%m-%d')}...[/dim]")
-
-    events, searches, commits = fetch_data_for_range(config, start, end)
-    display_summary(date, events, searches, commits)
+    _show_day(args, config, date, start, end)
 
 
 def cmd_day(args):
@@ -88,10 +90,7 @@ def cmd_day(args):
         date = datetime.now()
 
     start, end = get_date_range(date)
-    console.print(f"[dim]Fetching data for {date.strftime('%Y-%m-%d')}...[/dim]")
-
-    events, searches, commits = fetch_data_for_range(config, start, end)
-    display_summary(date, events, searches, commits)
+    _show_day(args, config, date, start, end)
 
 
 def cmd_week(args):
@@ -106,7 +105,7 @@ def cmd_week(args):
         try:
             year, week_num = parse_week(args.week)
             # Get the Monday of the specified week
-            start = datetime.strptime(f'{year}-W{week_num:02d}-1', '%G-W%V-%u')
+            start = datetime.fromisocalendar(year, week_num, 1)
         except ValueError as e:
             console.print(f"[red]Error: Invalid week format. Use 'YYYY-Wnn' or just the week number: {e}[/red]")
             sys.exit(1)
@@ -117,9 +116,7 @@ def cmd_week(args):
     week_num = start.isocalendar()[1]
     title = f"Work Summary for Week {week_num}, {start.year}"
 
-    console.print(f"[dim]Fetching data for week {week_num}...[/dim]")
-    events, searches, commits = fetch_data_for_range(config, start, end)
-    display_range_summary(title, start, end, events, searches, commits)
+    _show_range(args, config, title, f"week {week_num}", start, end)
 
 
 def cmd_month(args):
@@ -144,6 +141,28 @@ def cmd_month(args):
     month_name = start.strftime("%B %Y")
     title = f"Work Summary for {month_name}"
 
-    console.print(f"[dim]Fetching data for {month_name}...[/dim]")
-    events, searches, commits = fetch_data_for_range(config, start, end)
-    display_range_summary(title, start, end, events, searches, commits)
+    _show_range(args, config, title, month_name, start, end)
+
+
+def _show_day(args, config: dict, date: datetime, start: datetime, end: datetime):
+    """Fetch a day's data and print it as tables, or as JSON with --json."""
+    out = err_console if args.json else console
+    out.print(f"[dim]Fetching data for {date.strftime('%Y-%m-%d')}...[/dim]")
+
+    events, searches, commits = fetch_data_for_range(config, start, end, out, use_cache=not args.no_cache)
+    if args.json:
+        display_json(start, end, events, searches, commits)
+    else:
+        display_summary(date, events, searches, commits)
+
+
+def _show_range(args, config: dict, title: str, label: str, start: datetime, end: datetime):
+    """Fetch a range's data and print it as tables, or as JSON with --json."""
+    out = err_console if args.json else console
+    out.print(f"[dim]Fetching data for {label}...[/dim]")
+
+    events, searches, commits = fetch_data_for_range(config, start, end, out, use_cache=not args.no_cache)
+    if args.json:
+        display_json(start, end, events, searches, commits, title=title)
+    else:
+        display_range_summary(title, start, end, events, searches, commits)
@@ -3,7 +3,6 @@ Configuration management for Worklog CLI.
 Handles storing and loading API credentials securely.
 """
 
-import json
 import os
 from pathlib import Path
 from typing import Optional
@@ -11,44 +10,63 @@ from typing import Optional
 from rich.console import Console
 from rich.prompt import Prompt, Confirm
 
+from utils.serialization import dumps_json, loads_json
+
 console = Console()
 
 CONFIG_DIR = Path.home() / ".worklog"
 CONFIG_FILE = CONFIG_DIR / "config.json"
 CREDENTIALS_FILE = CONFIG_DIR / "google_credentials.json"
 TOKEN_FILE = CONFIG_DIR / "google_token.json"
+CACHE_DIR = CONFIG_DIR / "cache"
+
+# Parsed config, reused until the file's mtime changes
+_CACHE = {"mtime": None, "data": None}
+
+# Whether ensure_config_dir() has already run in this process
+_dir_ready = False
 
 
 def ensure_config_dir():
     """Ensure the config directory exists."""
+    global _dir_ready
+    if _dir_ready:
+        return
     CONFIG_DIR.mkdir(exist_ok=True)
     # Set restrictive permissions
     os.chmod(CONFIG_DIR, 0o700)
+    _dir_ready = True
 
 
 def load_config() -> dict:
-    """Load configuration from file."""
-    if not CONFIG_FILE.exists():
+    """Load configuration from file, reusing the parsed copy while it is unchanged.
+
+    Callers get their own copy, so changing it does not affect anyone else.
+    """
+    try:
+        mtime = CONFIG_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
         return {}
-    
-    with open(CONFIG_FILE, "r") as f:
-        return json.load(f)
+
+    if mtime != _CACHE["mtime"]:
+        with open(CONFIG_FILE, "rb") as f:
+            _CACHE["data"] = loads_json(f.read())
+        _CACHE["mtime"] = mtime
+    return dict(_CACHE["data"])
 
 
 def save_config(config: dict):
     """Save configuration to file."""
     ensure_config_dir()
     with open(CONFIG_FILE, "w") as f:
-        json.dump(config, f, indent=2)
+        f.write(dumps_json(config, indent=True))
     os.chmod(CONFIG_FILE, 0o600)
+    _CACHE["mtime"] = None
 
 
 def is_configured() -> bool:
     """Check if the tool is configured."""
-    if not CONFIG_FILE.exists():
-        return False
-    config = load_config()
-    return bool(config.get("github_token"))
+    return bool(load_config().get("github_token"))
 
 
 def is_ai_configured() -> bool:
@@ -229,93 +247,117 @@ def detect_chrome_profile() -> Optional[str]:
 
 
 def test_connections(config: dict):
-    """Test all configured connections."""
+    """Test all configured connections concurrently, reporting in a fixed order."""
+    import requests
+    from concurrent.futures import ThreadPoolExecutor
+
     console.print()
     console.print("[bold]Testing connections...[/bold]")
     console.print()
-    
-    # Test GitHub
-    if config.get("github_token"):
-        try:
-            import requests
-            headers = {"Authorization": f"token {config['github_token']}"}
-            resp = requests.get("https://api.github.com/user", headers=headers)
-            if resp.status_code == 200:
-                user = resp.json()
-                console.print(f"   [green]✓ GitHub:[/green] Connected as {user['login']}")
-            else:
-                console.print(f"   [red]✗ GitHub:[/red] Authentication failed ({resp.status_code})")
-        except Exception as e:
-            console.print(f"   [red]✗ GitHub:[/red] {e}")
-    else:
-        console.print("   [yellow]○ GitHub:[/yellow] Not configured")
-    
-    # Test Google Calendar
-    if CREDENTIALS_FILE.exists():
-        try:
-            from sources import test_calendar_connection
-            if test_calendar_connection(config):
-                console.print("   [green]✓ Google Calendar:[/green] Connected")
-            else:
-                console.print("   [yellow]○ Google Calendar:[/yellow] Needs authentication (will prompt on first use)")
-        except Exception as e:
-            console.print(f"   [red]✗ Google Calendar:[/red] {e}")
-    else:
-        console.print("   [yellow]○ Google Calendar:[/yellow] Credentials not configured")
-
-    # Test Chrome History
+
+    session = requests.Session()
+    checks = [
+        lambda: _test_github(config, session),
+        lambda: _test_chrome(config),
+        lambda: _test_slack(config),
+        lambda: _test_linear(config),
+        lambda: _test_anthropic(config),
+    ]
+
+    with console.status("[bold]Checking services...[/bold]"):
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            lines = list(executor.map(lambda check: check(), checks))
+
+    # Calendar auth may need the user (browser, local OAuth server), so it runs on
+    # the main thread once the spinner is gone; its line keeps its place in the report
+    lines.insert(1, _test_calendar(config))
+
+    for line in lines:
+        console.print(line)
+
+    console.print()
+
+
+def _test_github(config: dict, session) -> str:
+    """Check the GitHub token."""
+    if not config.get("github_token"):
+        return "   [yellow]○ GitHub:[/yellow] Not configured"
+    try:
+        headers = {"Authorization": f"token {config['github_token']}"}
+        resp = session.get("https://api.github.com/user", headers=headers, timeout=(3, 5))
+        if resp.status_code == 200:
+            user = loads_json(resp.content)
+            return f"   [green]✓ GitHub:[/green] Connected as {user['login']}"
+        return f"   [red]✗ GitHub:[/red] Authentication failed ({resp.status_code})"
+    except Exception as e:
+        return f"   [red]✗ GitHub:[/red] {e}"
+
+
+def _test_calendar(config: dict) -> str:
+    """Check the Google Calendar credentials."""
+    if not CREDENTIALS_FILE.exists():
+        return "   [yellow]○ Google Calendar:[/yellow] Credentials not configured"
+    try:
+        from sources import test_calendar_connection
+        if test_calendar_connection(config):
+            return "   [green]✓ Google Calendar:[/green] Connected"
+        return "   [yellow]○ Google Calendar:[/yellow] Needs authentication (will prompt on first use)"
+    except Exception as e:
+        return f"   [red]✗ Google Calendar:[/red] {e}"
+
+
+def _test_chrome(config: dict) -> str:
+    """Check the Chrome history database."""
     try:
         from sources import test_chrome_access
         if test_chrome_access(config.get("chrome_profile")):
-            console.print("   [green]✓ Chrome History:[/green] Accessible")
-        else:
-            console.print("   [red]✗ Chrome History:[/red] Could not access history database")
+            return "   [green]✓ Chrome History:[/green] Accessible"
+        return "   [red]✗ Chrome History:[/red] Could not access history database"
     except Exception as e:
-        console.print(f"   [red]✗ Chrome History:[/red] {e}")
-
-    # Test Slack
-    if config.get("slack_token"):
-        try:
-            from sources import get_slack_user_info
-            user_info = get_slack_user_info(config)
-            if user_info:
-                console.print(f"   [green]✓ Slack:[/green] Connected as {user_info['user']} ({user_info['team']})")
-            else:
-                console.print("   [red]✗ Slack:[/red] Could not authenticate")
-        except Exception as e:
-            console.print(f"   [red]✗ Slack:[/red] {e}")
-    else:
-        console.print("   [yellow]○ Slack:[/yellow] Not configured")
-
-    # Test Linear
-    if config.get("linear_api_key"):
-        try:
-            from sources import get_linear_user_info
-            user_info = get_linear_user_info(config)
-            if user_info:
-                console.print(f"   [green]✓ Linear:[/green] Connected as {user_info['name']} ({user_info['organization']})")
-            else:
-                console.print("   [red]✗ Linear:[/red] Could not authenticate")
-        except Exception as e:
-            console.print(f"   [red]✗ Linear:[/red] {e}")
-    else:
-        console.print("   [yellow]○ Linear:[/yellow] Not configured")
-
-    # Test Anthropic API
-    if config.get("anthropic_api_key"):
-        try:
-            from anthropic import Anthropic
-            client = Anthropic(api_key=config["anthropic_api_key"])
-            # Make a minimal API call to verify the key works
-            response = client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=10,
-                messages=[{"role": "user", "content": "Hi"}]
-            )
-            console.print("   [green]✓ Anthropic:[/green] API key valid")
-        except Exception as e:
-            console.print(f"   [red]✗ Anthropic:[/red] {e}")
-    else:
-        console.print("   [yellow]○ Anthropic:[/yellow] Not configured")
+        return f"   [red]✗ Chrome History:[/red] {e}"
 
-    console.print()
+
+def _test_slack(config: dict) -> str:
+    """Check the Slack token."""
+    if not config.get("slack_token"):
+        return "   [yellow]○ Slack:[/yellow] Not configured"
+    try:
+        from sources import get_slack_user_info
+        user_info = get_slack_user_info(config)
+        if user_info:
+            return f"   [green]✓ Slack:[/green] Connected as {user_info['user']} ({user_info['team']})"
+        return "   [red]✗ Slack:[/red] Could not authenticate"
+    except Exception as e:
+        return f"   [red]✗ Slack:[/red] {e}"
+
+
+def _test_linear(config: dict) -> str:
+    """Check the Linear API key."""
+    if not config.get("linear_api_key"):
+        return "   [yellow]○ Linear:[/yellow] Not configured"
+    try:
+        from sources import get_linear_user_info
+        user_info = get_linear_user_info(config)
+        if user_info:
+            return f"   [green]✓ Linear:[/green] Connected as {user_info['name']} ({user_info['organization']})"
+        return "   [red]✗ Linear:[/red] Could not authenticate"
+    except Exception as e:
+        return f"   [red]✗ Linear:[/red] {e}"
+
+
+def _test_anthropic(config: dict) -> str:
+    """Check the Anthropic API key."""
+    if not config.get("anthropic_api_key"):
+        return "   [yellow]○ Anthropic:[/yellow] Not configured"
+    try:
+        from anthropic import Anthropic
+        client = Anthropic(api_key=config["anthropic_api_key"], timeout=10, max_retries=0)
+        # Make a minimal API call to verify the key works
+        client.messages.create(
+            model="claude-sonnet-4-20250514",
+            max_tokens=10,
+            messages=[{"role": "user", "content": "Hi"}]
+        )
+        return "   [green]✓ Anthropic:[/green] API key valid"
+    except Exception as e:
+        return f"   [red]✗ Anthropic:[/red] {e}"
@@ -2,6 +2,6 @@
 Display and formatting functions for Worklog CLI.
 """
 
-from display.summary import display_summary, display_range_summary
+from display.summary import display_summary, display_range_summary, display_json
 
-__all__ = ["display_summary", "display_range_summary"]
+__all__ = ["display_summary", "display_range_summary", "display_json"]
@@ -2,16 +2,104 @@
 Summary display functions for Worklog CLI.
 """
 
+import sys
 from datetime import datetime
+from functools import wraps
+from typing import Iterable
 
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
+from rich.style import Style
+from rich.text import Text
 from rich import box
 
-console = Console()
+from utils.serialization import dumps_json
 
+console = Console()
 
+# Column styles parsed once and shared by every table
+_CYAN = Style.parse("cyan")
+_WHITE = Style.parse("white")
+_GREEN = Style.parse("green")
+_DIM = Style.parse("dim")
+_YELLOW = Style.parse("yellow")
+_BOLD = Style.parse("bold")
+
+# Section headers and placeholders parsed from markup once
+_HEADER_EVENTS = Text.from_markup("[bold magenta]📅 Calendar Events[/bold magenta]")
+_HEADER_SEARCHES = Text.from_markup("[bold blue]🔍 Search History[/bold blue]")
+_HEADER_COMMITS = Text.from_markup("[bold green]💻 GitHub Commits[/bold green]")
+_HEADER_STATS = Text.from_markup("[bold yellow]📊 Summary[/bold yellow]")
+_NO_EVENTS = Text.from_markup("  [dim]No calendar events found[/dim]")
+_NO_SEARCHES = Text.from_markup("  [dim]No search history found[/dim]")
+_NO_COMMITS = Text.from_markup("  [dim]No GitHub commits found[/dim]")
+
+# Column specs: (header, add_column kwargs)
+_DAY_EVENT_COLUMNS = (
+    ("Time", {"style": _CYAN, "width": 20}),
+    ("Event", {"style": _WHITE}),
+    ("Duration", {"style": _GREEN, "width": 12}),
+)
+_DAY_SEARCH_COLUMNS = (
+    ("Time", {"style": _CYAN, "width": 12}),
+    ("Search Query / Page Title", {"style": _WHITE}),
+    ("URL", {"style": _DIM, "max_width": 50, "overflow": "ellipsis"}),
+)
+_DAY_COMMIT_COLUMNS = (
+    ("Time", {"style": _CYAN, "width": 12}),
+    ("Repository", {"style": _YELLOW, "width": 25}),
+    ("Commit Message", {"style": _WHITE, "max_width": 60, "no_wrap": True, "overflow": "ellipsis"}),
+    ("Changes", {"style": _GREEN, "width": 15}),
+)
+_RANGE_EVENT_COLUMNS = (
+    ("Date", {"style": _CYAN, "width": 12}),
+    ("Time", {"style": _CYAN, "width": 15}),
+    ("Event", {"style": _WHITE}),
+    ("Duration", {"style": _GREEN, "width": 12}),
+)
+_RANGE_SEARCH_COLUMNS = (
+    ("Date", {"style": _CYAN, "width": 12}),
+    ("Time", {"style": _CYAN, "width": 8}),
+    ("Search Query / Page Title", {"style": _WHITE}),
+    ("URL", {"style": _DIM, "max_width": 40, "overflow": "ellipsis"}),
+)
+_RANGE_COMMIT_COLUMNS = (
+    ("Date", {"style": _CYAN, "width": 12}),
+    ("Time", {"style": _CYAN, "width": 8}),
+    ("Repository", {"style": _YELLOW, "width": 25}),
+    ("Commit Message", {"style": _WHITE, "max_width": 50, "no_wrap": True, "overflow": "ellipsis"}),
+    ("Changes", {"style": _GREEN, "width": 12}),
+)
+
+
+def _make_table(columns: tuple) -> Table:
+    """Build a summary table with the given column specs."""
+    table = Table(show_header=True, header_style="bold", box=box.ROUNDED)
+    for name, options in columns:
+        table.add_column(name, **options)
+    return table
+
+
+def _add_rows(table: Table, rows: Iterable[tuple]):
+    """Append row tuples to a table, consuming them lazily."""
+    # Cells hold user data, so they become plain Text: Rich skips the markup
+    # parser and brackets in titles or messages print literally. Styles come
+    # from the columns
+    for row in rows:
+        table.add_row(*(Text(cell or "") for cell in row))
+
+
+def _buffered(func):
+    """Buffer everything a display function prints and write it to the terminal once."""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        with console:
+            return func(*args, **kwargs)
+    return wrapper
+
+
+@_buffered
 def display_summary(date: datetime, events: list, searches: list, commits: list):
     """Display a formatted summary of the day's activities."""
     date_str = date.strftime("%A, %B %d, %Y")
@@ -21,69 +109,49 @@ def display_summary(date: datetime, events: list, searches: list, commits: list)
     console.print()
 
     # Calendar Events
-    console.print("[bold magenta]📅 Calendar Events[/bold magenta]")
+    console.print(_HEADER_EVENTS)
     if events:
-        table = Table(show_header=True, header_style="bold", box=box.ROUNDED)
-        table.add_column("Time", style="cyan", width=20)
-        table.add_column("Event", style="white")
-        table.add_column("Duration", style="green", width=12)
+        table = _make_table(_DAY_EVENT_COLUMNS)
 
-        for event in events:
-            table.add_row(event["time"], event["summary"], event["duration"])
+        _add_rows(table, ((e["time"], e["summary"], e["duration"]) for e in events))
         console.print(table)
     else:
-        console.print("  [dim]No calendar events found[/dim]")
+        console.print(_NO_EVENTS)
     console.print()
 
     # Chrome Search History
-    console.print("[bold blue]🔍 Search History[/bold blue]")
+    console.print(_HEADER_SEARCHES)
     if searches:
-        table = Table(show_header=True, header_style="bold", box=box.ROUNDED)
-        table.add_column("Time", style="cyan", width=12)
-        table.add_column("Search Query / Page Title", style="white")
-        table.add_column("URL", style="dim", max_width=50, overflow="ellipsis")
+        table = _make_table(_DAY_SEARCH_COLUMNS)
 
         # Group and deduplicate, show top 20
-        seen = set()
-        count = 0
-        for search in searches:
-            key = search["title"].lower()
-            if key not in seen and count < 20:
-                seen.add(key)
-                table.add_row(search["time"], search["title"], search["url"])
-                count += 1
+        _add_rows(table, ((s["time"], s["title"], s["url"]) for s in _dedup_top(searches, 20)))
         console.print(table)
         if len(searches) > 20:
             console.print(f"  [dim]... and {len(searches) - 20} more entries[/dim]")
     else:
-        console.print("  [dim]No search history found[/dim]")
+        console.print(_NO_SEARCHES)
     console.print()
 
     # GitHub Commits
-    console.print("[bold green]💻 GitHub Commits[/bold green]")
+    console.print(_HEADER_COMMITS)
     if commits:
-        table = Table(show_header=True, header_style="bold", box=box.ROUNDED)
-        table.add_column("Time", style="cyan", width=12)
-        table.add_column("Repository", style="yellow", width=25)
-        table.add_column("Commit Message", style="white")
-        table.add_column("Changes", style="green", width=15)
-
-        for commit in commits:
-            table.add_row(
-                commit["time"],
-                commit["repo"],
-                commit["message"][:60] + ("..." if len(commit["message"]) > 60 else ""),
-                commit["changes"]
-            )
+        table = _make_table(_DAY_COMMIT_COLUMNS)
+
+        _add_rows(table, (
+            (c["time"], c["repo"], c["message"], c["changes"])
+            for c in commits
+        ))
         console.print(table)
     else:
-        console.print("  [dim]No GitHub commits found[/dim]")
+        console.print(_NO_COMMITS)
     console.print()
 
     # Summary Stats
     _display_stats(events, searches, commits)
 
 
+@_buffered
 def display_range_summary(title: str, start: datetime, end: datetime, events: list, searches: list, commits: list):
     """Display a formatted summary for a date range."""
     console.print()
@@ -92,85 +160,93 @@ def display_range_summary(title: str, start: datetime, end: datetime, events: li
     console.print()
 
     # Calendar Events
-    console.print("[bold magenta]📅 Calendar Events[/bold magenta]")
+    console.print(_HEADER_EVENTS)
     if events:
-        table = Table(show_header=True, header_style="bold", box=box.ROUNDED)
-        table.add_column("Date", style="cyan", width=12)
-        table.add_column("Time", style="cyan", width=15)
-        table.add_column("Event", style="white")
-        table.add_column("Duration", style="green", width=12)
-
-        for event in events:
-            table.add_row(event.get("date", ""), event["time"], event["summary"], event["duration"])
+        table = _make_table(_RANGE_EVENT_COLUMNS)
+
+        _add_rows(table, ((e.get("date", ""), e["time"], e["summary"], e["duration"]) for e in events))
         console.print(table)
     else:
-        console.print("  [dim]No calendar events found[/dim]")
+        console.print(_NO_EVENTS)
     console.print()
 
     # Chrome Search History
-    console.print("[bold blue]🔍 Search History[/bold blue]")
+    console.print(_HEADER_SEARCHES)
     if searches:
-        table = Table(show_header=True, header_style="bold", box=box.ROUNDED)
-        table.add_column("Date", style="cyan", width=12)
-        table.add_column("Time", style="cyan", width=8)
-        table.add_column("Search Query / Page Title", style="white")
-        table.add_column("URL", style="dim", max_width=40, overflow="ellipsis")
-
-        seen = set()
-        count = 0
-        for search in searches:
-            key = search["title"].lower()
-            if key not in seen and count < 30:
-                seen.add(key)
-                date_str = search.get("datetime", datetime.now()).strftime("%Y-%m-%d") if search.get("datetime") else ""
-                table.add_row(date_str, search["time"], search["title"], search["url"])
-                count += 1
+        table = _make_table(_RANGE_SEARCH_COLUMNS)
+
+        _add_rows(table, (
+            (s["date"], s["time"], s["title"], s["url"])
+            for s in _dedup_top(searches, 30)
+        ))
         console.print(table)
         if len(searches) > 30:
             console.print(f"  [dim]... and {len(searches) - 30} more entries[/dim]")
     else:
-        console.print("  [dim]No search history found[/dim]")
+        console.print(_NO_SEARCHES)
     console.print()
 
     # GitHub Commits
-    console.print("[bold green]💻 GitHub Commits[/bold green]")
+    console.print(_HEADER_COMMITS)
     if commits:
-        table = Table(show_header=True, header_style="bold", box=box.ROUNDED)
-        table.add_column("Date", style="cyan", width=12)
-        table.add_column("Time", style="cyan", width=8)
-        table.add_column("Repository", style="yellow", width=25)
-        table.add_column("Commit Message", style="white")
-        table.add_column("Changes", style="green", width=12)
-
-        for commit in commits:
-            table.add_row(
-                commit.get("date", ""),
-                commit["time"],
-                commit["repo"],
-                commit["message"][:50] + ("..." if len(commit["message"]) > 50 else ""),
-                commit["changes"]
-            )
+        table = _make_table(_RANGE_COMMIT_COLUMNS)
+
+        _add_rows(table, (
+            (c.get("date", ""), c["time"], c["repo"], c["message"], c["changes"])
+            for c in commits
+        ))
         console.print(table)
     else:
-        console.print("  [dim]No GitHub commits found[/dim]")
+        console.print(_NO_COMMITS)
     console.print()
 
     # Summary Stats
     _display_stats(events, searches, commits)
 
 
+def display_json(start: datetime, end: datetime, events: list, searches: list, commits: list, title: str = None):
+    """Write the fetched data to stdout as one JSON document, bypassing Rich entirely."""
+    document = {
+        "start": start.isoformat(),
+        "end": end.isoformat(),
+        "events": events,
+        "searches": searches,
+        "commits": commits,
+    }
+    if title:
+        document = {"title": title, **document}
+    sys.stdout.write(dumps_json(document))
+    sys.stdout.write("\n")
+
+
+def _dedup_top(searches: list, n: int) -> list:
+    """Return the first n searches with distinct (case-insensitive) titles, stopping once n are found."""
+    unique = {}
+    for search in searches:
+        # Casefolded title is memoized on the search so repeat renders reuse it
+        key = search.get("_lk") or search.setdefault("_lk", search["title"].casefold())
+        # setdefault hands back the earlier search when the title was already seen
+        if unique.setdefault(key, search) is not search:
+            continue
+        if len(unique) == n:
+            break
+    return list(unique.values())
+
+
 def _display_stats(events: list, searches: list, commits: list):
     """Display summary statistics."""
-    console.print("[bold yellow]📊 Summary[/bold yellow]")
+    console.print(_HEADER_STATS)
     stats_table = Table(show_header=False, box=box.SIMPLE)
-    stats_table.add_column("Metric", style="bold")
-    stats_table.add_column("Value", style="cyan")
+    stats_table.add_column("Metric", style=_BOLD)
+    stats_table.add_column("Value", style=_CYAN)
     stats_table.add_row("Calendar events", str(len(events)))
     stats_table.add_row("Searches/pages visited", str(len(searches)))
     stats_table.add_row("Commits", str(len(commits)))
 
-    total_commit_additions = sum(c.get("additions", 0) for c in commits)
-    total_commit_deletions = sum(c.get("deletions", 0) for c in commits)
+    total_commit_additions = total_commit_deletions = 0
+    for commit in commits:
+        total_commit_additions += commit.get("additions", 0)
+        total_commit_deletions += commit.get("deletions", 0)
     if commits:
         stats_table.add_row("Lines added", f"+{total_commit_additions}")
         stats_table.add_row("Lines deleted", f"-{total_commit_deletions}")
@@ -1,5 +1,5 @@
 """MCP (Model Context Protocol) servers for CTO CLI."""
 
-from mcp.linear import LinearMCPServer, test_linear_connection, get_linear_user_info
+from mcp.linear import LinearMCPServer, get_linear_server, test_linear_connection, get_linear_user_info
 
-__all__ = ["LinearMCPServer", "test_linear_connection", "get_linear_user_info"]
+__all__ = ["LinearMCPServer", "get_linear_server", "test_linear_connection", "get_linear_user_info"]
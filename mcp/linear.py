@@ -3,14 +3,434 @@ Linear MCP Server for CTO CLI.
 Provides tools for querying Linear audit logs and workspace data.
 """
 
-import json
+import sys
 import requests
+from requests.adapters import HTTPAdapter
+from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
-from typing import Optional
+from functools import lru_cache
+from itertools import islice
+from typing import Iterator, Optional
+
+from utils.cache import cache_get, cache_set, ttl_cache
+from utils.http import CappedRetry
+from utils.serialization import dumps_json, loads_json
 
 # Linear GraphQL API endpoint
 LINEAR_API_URL = "https://api.linear.app/graphql"
 
+# Largest page requested from a paginated connection
+MAX_PAGE_SIZE = 100
+
+# Seconds to wait for a Linear API response (connect, read)
+REQUEST_TIMEOUT = (5, 30)
+
+# Seconds slow-changing workspace data is cached on disk
+TEAMS_CACHE_TTL = 60 * 60
+ENTRY_TYPES_CACHE_TTL = 24 * 60 * 60
+VIEWER_CACHE_TTL = 24 * 60 * 60
+
+# Slotted records drop the per-instance __dict__; dataclass(slots=) needs Python 3.10+
+_RECORD_OPTIONS = {"frozen": True, "slots": True} if sys.version_info >= (3, 10) else {"frozen": True}
+
+
+@dataclass(**_RECORD_OPTIONS)
+class AuditEntry:
+    """A flattened audit log entry."""
+    id: Optional[str]
+    type: Optional[str]
+    timestamp: Optional[str]
+    ip: Optional[str]
+    country: Optional[str]
+    actor: Optional[str]
+    actor_email: Optional[str]
+    metadata: Optional[dict]
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+@dataclass(**_RECORD_OPTIONS)
+class Issue:
+    """A flattened issue assigned to the viewer."""
+    id: Optional[str]
+    title: Optional[str]
+    description: Optional[str]
+    priority: Optional[int]
+    state: Optional[str]
+    project: Optional[str]
+    team: Optional[str]
+    labels: list
+    created_at: Optional[str]
+    updated_at: Optional[str]
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+@dataclass(**_RECORD_OPTIONS)
+class Activity:
+    """A recently updated issue."""
+    id: Optional[str]
+    title: Optional[str]
+    state: Optional[str]
+    team: Optional[str]
+    updated_at: Optional[str]
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+# Static, named queries; filters are sent as GraphQL variables rather than interpolated,
+# so the server sees one canonical document per operation
+_AUDIT_QUERY = """
+query AuditEntries($filter: AuditEntryFilter, $first: Int!, $after: String) {
+    auditEntries(filter: $filter, first: $first, after: $after) {
+        nodes {
+            id
+            type
+            createdAt
+            ip
+            countryCode
+            actor {
+                id
+                name
+                email
+            }
+            metadata
+        }
+        pageInfo {
+            hasNextPage
+            endCursor
+        }
+    }
+}
+"""
+
+_ASSIGNED_ISSUES_QUERY = """
+query AssignedIssues($filter: IssueFilter, $first: Int!, $after: String, $withDescription: Boolean!) {
+    viewer {
+        assignedIssues(filter: $filter, first: $first, after: $after) {
+            nodes {
+                id
+                identifier
+                title
+                description @include(if: $withDescription)
+                priority
+                createdAt
+                updatedAt
+                state {
+                    name
+                    color
+                }
+                project {
+                    name
+                }
+                team {
+                    name
+                }
+                labels {
+                    nodes {
+                        name
+                        color
+                    }
+                }
+            }
+            pageInfo {
+                hasNextPage
+                endCursor
+            }
+        }
+    }
+}
+"""
+
+_ACTIVITY_QUERY = """
+query RecentActivity($filter: IssueFilter, $first: Int!, $after: String) {
+    viewer {
+        assignedIssues(filter: $filter, first: $first, after: $after, orderBy: updatedAt) {
+            nodes {
+                identifier
+                title
+                state {
+                    name
+                }
+                updatedAt
+                team {
+                    name
+                }
+            }
+            pageInfo {
+                hasNextPage
+                endCursor
+            }
+        }
+    }
+}
+"""
+
+_ENTRY_TYPES_QUERY = """
+query AuditEntryTypes {
+    auditEntryTypes {
+        type
+        description
+    }
+}
+"""
+
+_SEARCH_QUERY = """
+query SearchIssues($query: String!, $limit: Int!) {
+    searchIssues(query: $query, first: $limit) {
+        nodes {
+            id
+            identifier
+            title
+            description
+            state {
+                name
+            }
+            team {
+                name
+            }
+            assignee {
+                name
+            }
+        }
+    }
+}
+"""
+
+# Selection sets shared by the single-resource queries and batch_fetch
+_VIEWER_FIELDS = """
+    id
+    name
+    email
+    admin
+    organization {
+        name
+        urlKey
+    }
+"""
+
+_TEAM_FIELDS = """
+    id
+    name
+    key
+    description
+    members @include(if: $includeMembers) {
+        nodes {
+            name
+            email
+        }
+    }
+"""
+
+_PROJECT_FIELDS = """
+    id
+    name
+    description
+    state
+    progress
+    health
+    targetDate
+    startDate
+    updatedAt
+    createdAt
+    lead {
+        name
+    }
+    teams {
+        nodes {
+            name
+            key
+        }
+    }
+    latestUpdate: projectUpdates(first: 1, orderBy: createdAt) {
+        nodes {
+            body
+            health
+            createdAt
+            user {
+                name
+            }
+        }
+    }
+    recentUpdates: projectUpdates(first: 10, orderBy: createdAt) {
+        nodes {
+            health
+            createdAt
+        }
+    }
+"""
+
+# Only what the projects table renders: no descriptions, teams or update bodies
+_PROJECT_TABLE_FIELDS = """
+    id
+    name
+    state
+    progress
+    health
+    targetDate
+    updatedAt
+    lead {
+        name
+    }
+    latestUpdate: projectUpdates(first: 1, orderBy: createdAt) {
+        nodes {
+            createdAt
+        }
+    }
+    recentUpdates: projectUpdates(first: 10, orderBy: createdAt) {
+        nodes {
+            health
+            createdAt
+        }
+    }
+"""
+
+# Named project selection sets, so each call site fetches only what it reads
+_LINEAR_SELECTION_PROFILES = {
+    "full": _PROJECT_FIELDS,
+    "table": _PROJECT_TABLE_FIELDS,
+}
+
+_VIEWER_QUERY = "query Viewer { viewer {" + _VIEWER_FIELDS + "} }"
+_TEAMS_QUERY = "query Teams($includeMembers: Boolean!) { teams { nodes {" + _TEAM_FIELDS + "} } }"
+_PROJECTS_QUERIES = {
+    profile: (
+        "query Projects($filter: ProjectFilter) {"
+        " projects(filter: $filter, first: 100, orderBy: updatedAt) { nodes {" + fields + "} } }"
+    )
+    for profile, fields in _LINEAR_SELECTION_PROFILES.items()
+}
+
+
+def _date_range(start: Optional[datetime], end: Optional[datetime]) -> dict:
+    """Build a GraphQL date comparator from optional bounds."""
+    comparator = {}
+    if start:
+        comparator["gte"] = start.isoformat()
+    if end:
+        comparator["lte"] = end.isoformat()
+    return comparator
+
+
+def _project_filter(team_key: Optional[str], include_completed: bool) -> Optional[dict]:
+    """Build the ProjectFilter for get_projects."""
+    filters = {}
+    if team_key:
+        filters["accessibleTeams"] = {"key": {"eq": team_key}}
+    if not include_completed:
+        # Only include active projects (not completed or canceled)
+        filters["state"] = {"nin": ["completed", "canceled"]}
+    return filters or None
+
+
+def _format_audit_entry(e: dict) -> AuditEntry:
+    """Flatten an audit entry node."""
+    actor = e.get("actor") or {}
+    return AuditEntry(
+        id=e.get("id"),
+        type=e.get("type"),
+        timestamp=e.get("createdAt"),
+        ip=e.get("ip"),
+        country=e.get("countryCode"),
+        actor=actor.get("name") or actor.get("email"),
+        actor_email=actor.get("email"),
+        metadata=e.get("metadata"),
+    )
+
+
+def _format_issue(i: dict, truncate_description: int) -> Issue:
+    """Flatten an assigned issue node."""
+    return Issue(
+        id=i.get("identifier"),
+        title=i.get("title"),
+        description=(i.get("description") or "")[:truncate_description] if truncate_description else None,
+        priority=i.get("priority"),
+        state=i.get("state", {}).get("name"),
+        project=i.get("project", {}).get("name") if i.get("project") else None,
+        team=i.get("team", {}).get("name"),
+        labels=[l.get("name") for l in i.get("labels", {}).get("nodes", [])],
+        created_at=i.get("createdAt"),
+        updated_at=i.get("updatedAt"),
+    )
+
+
+def _format_activity(i: dict) -> Activity:
+    """Flatten a recently updated issue node."""
+    return Activity(
+        id=i.get("identifier"),
+        title=i.get("title"),
+        state=i.get("state", {}).get("name"),
+        team=i.get("team", {}).get("name"),
+        updated_at=i.get("updatedAt"),
+    )
+
+
+def _format_viewer(viewer: dict) -> dict:
+    """Flatten a viewer node."""
+    return {
+        "id": viewer.get("id"),
+        "name": viewer.get("name"),
+        "email": viewer.get("email"),
+        "is_admin": viewer.get("admin"),
+        "organization": viewer.get("organization", {}).get("name"),
+        "org_url": viewer.get("organization", {}).get("urlKey"),
+    }
+
+
+def _format_team(t: dict, include_members: bool) -> dict:
+    """Flatten a team node."""
+    team = {
+        "id": t.get("id"),
+        "name": t.get("name"),
+        "key": t.get("key"),
+        "description": t.get("description"),
+    }
+    if include_members:
+        team["members"] = [
+            {"name": m.get("name"), "email": m.get("email")}
+            for m in t.get("members", {}).get("nodes", [])
+        ]
+    return team
+
+
+def _format_project(p: dict) -> dict:
+    """Flatten a project node, picking out its latest update and latest health update."""
+    # The latest update carries its body; recent updates only health + timestamp
+    latest_nodes = p.get("latestUpdate", {}).get("nodes", [])
+    latest_update = latest_nodes[0] if latest_nodes else None
+    updates = p.get("recentUpdates", {}).get("nodes", [])
+
+    # Most recent update that has a health value; already sorted by createdAt desc
+    latest_health_update = next((u for u in updates if u.get("health")), None)
+
+    return {
+        "id": p.get("id"),
+        "name": p.get("name"),
+        "description": (p.get("description") or "")[:200],
+        "state": p.get("state"),
+        "progress": p.get("progress"),
+        "health": p.get("health"),
+        "target_date": p.get("targetDate"),
+        "start_date": p.get("startDate"),
+        "updated_at": p.get("updatedAt"),
+        "created_at": p.get("createdAt"),
+        "lead": p.get("lead", {}).get("name") if p.get("lead") else None,
+        "teams": [t.get("name") for t in p.get("teams", {}).get("nodes", [])],
+        "latest_update": {
+            "body": (latest_update.get("body") or "")[:200] if latest_update else None,
+            "health": latest_update.get("health") if latest_update else None,
+            "created_at": latest_update.get("createdAt") if latest_update else None,
+            "author": latest_update.get("user", {}).get("name") if latest_update else None,
+        } if latest_update else None,
+        # Use the health update timestamp for sorting, fallback to any update, then project update
+        "health_updated_at": latest_health_update.get("createdAt") if latest_health_update else None,
+        "latest_health": latest_health_update.get("health") if latest_health_update else None,
+        "status_updated_at": latest_update.get("createdAt") if latest_update else p.get("updatedAt"),
+    }
+
 
 class LinearMCPServer:
     """MCP server for Linear integration."""
@@ -22,27 +442,74 @@ class LinearMCPServer:
             "Content-Type": "application/json",
         }
 
+        # Keep-alive session so back-to-back queries reuse the TLS connection
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        # Queries are read-only, so POSTs are safe to retry on transient failures;
+        # rate-limited (429) responses wait out the server's Retry-After first, up
+        # to a few seconds per attempt
+        retry = CappedRetry(
+            total=5,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset({"POST"}),
+            respect_retry_after_header=True,
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=retry)
+        self.session.mount("https://", adapter)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Close pooled connections."""
+        self.session.close()
+
     def _query(self, query: str, variables: dict = None) -> dict:
         """Execute a GraphQL query against Linear API."""
         payload = {"query": query}
         if variables:
             payload["variables"] = variables
 
-        response = requests.post(
+        response = self.session.post(
             LINEAR_API_URL,
-            headers=self.headers,
-            json=payload,
+            data=dumps_json(payload).encode(),
+            timeout=REQUEST_TIMEOUT,
         )
 
         if response.status_code != 200:
             raise Exception(f"Linear API error: {response.status_code} - {response.text}")
 
-        data = response.json()
+        data = loads_json(response.content)
         if "errors" in data:
             raise Exception(f"Linear GraphQL error: {data['errors']}")
 
         return data.get("data", {})
 
+    def _paginate(self, query: str, path: tuple, variables: dict = None, page_size: int = MAX_PAGE_SIZE) -> Iterator[dict]:
+        """
+        Yield nodes from a paginated connection, fetching pages only as they are consumed.
+
+        The query must accept `$first: Int!` and `$after: String` and select
+        `pageInfo { hasNextPage endCursor }` on the connection found at `path`.
+        """
+        after = None
+        while True:
+            data = self._query(query, {**(variables or {}), "first": page_size, "after": after})
+            connection = data
+            for key in path:
+                connection = connection.get(key) or {}
+
+            yield from connection.get("nodes", [])
+
+            page_info = connection.get("pageInfo") or {}
+            if not page_info.get("hasNextPage"):
+                return
+            after = page_info.get("endCursor")
+
     def get_audit_logs(
         self,
         start_date: Optional[datetime] = None,
@@ -50,7 +517,7 @@ class LinearMCPServer:
         event_type: Optional[str] = None,
         actor_email: Optional[str] = None,
         limit: int = 100,
-    ) -> list[dict]:
+    ) -> list[AuditEntry]:
         """
         Fetch audit log entries from Linear.
 
@@ -64,153 +531,101 @@ class LinearMCPServer:
         Returns:
             List of audit log entries
         """
+        entries = self.iter_audit_logs(
+            start_date=start_date,
+            end_date=end_date,
+            event_type=event_type,
+            actor_email=actor_email,
+            page_size=min(limit, MAX_PAGE_SIZE),
+        )
+        return list(islice(entries, limit))
+
+    def iter_audit_logs(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        event_type: Optional[str] = None,
+        actor_email: Optional[str] = None,
+        page_size: int = MAX_PAGE_SIZE,
+    ) -> Iterator[AuditEntry]:
+        """Iterate over audit log entries, fetching further pages on demand."""
         # Build filter
-        filters = []
+        filters = {}
         if event_type:
-            filters.append(f'type: {{eq: "{event_type}"}}')
+            filters["type"] = {"eq": event_type}
         if actor_email:
-            filters.append(f'actor: {{email: {{eq: "{actor_email}"}}}}')
-        if start_date:
-            filters.append(f'createdAt: {{gte: "{start_date.isoformat()}"}}')
-        if end_date:
-            filters.append(f'createdAt: {{lte: "{end_date.isoformat()}"}}')
-
-        filter_str = ""
-        if filters:
-            filter_str = f"filter: {{{', '.join(filters)}}}, "
-
-        query = f"""
-        query {{
-            auditEntries({filter_str}first: {limit}) {{
-                nodes {{
-                    id
-                    type
-                    createdAt
-                    ip
-                    countryCode
-                    actor {{
-                        id
-                        name
-                        email
-                    }}
-                    metadata
-                }}
-                pageInfo {{
-                    hasNextPage
-                    endCursor
-                }}
-            }}
-        }}
-        """
-
-        data = self._query(query)
-        entries = data.get("auditEntries", {}).get("nodes", [])
-
-        return [
-            {
-                "id": e.get("id"),
-                "type": e.get("type"),
-                "timestamp": e.get("createdAt"),
-                "ip": e.get("ip"),
-                "country": e.get("countryCode"),
-                "actor": e.get("actor", {}).get("name") or e.get("actor", {}).get("email"),
-                "actor_email": e.get("actor", {}).get("email"),
-                "metadata": e.get("metadata"),
-            }
-            for e in entries
-        ]
+            filters["actor"] = {"email": {"eq": actor_email}}
+        created_at = _date_range(start_date, end_date)
+        if created_at:
+            filters["createdAt"] = created_at
+
+        entries = self._paginate(
+            _AUDIT_QUERY,
+            ("auditEntries",),
+            variables={"filter": filters or None},
+            page_size=page_size,
+        )
+        return map(_format_audit_entry, entries)
 
+    @ttl_cache(ttl=ENTRY_TYPES_CACHE_TTL)
     def get_audit_entry_types(self) -> list[dict]:
         """Get all available audit log entry types."""
-        query = """
-        query {
-            auditEntryTypes {
-                type
-                description
-            }
-        }
-        """
-        data = self._query(query)
-        return data.get("auditEntryTypes", [])
+        cached = cache_get("linear_entry_types", self.api_key)
+        if cached is not None:
+            return cached
+
+        data = self._query(_ENTRY_TYPES_QUERY)
+        entry_types = data.get("auditEntryTypes", [])
+        cache_set("linear_entry_types", self.api_key, entry_types, ENTRY_TYPES_CACHE_TTL)
+        return entry_types
 
     def get_my_issues(
         self,
         state: Optional[str] = None,
         limit: int = 50,
-    ) -> list[dict]:
+        truncate_description: int = 200,
+    ) -> list[Issue]:
         """
         Get issues assigned to the authenticated user.
 
         Args:
             state: Filter by state (e.g., 'started', 'completed', 'canceled')
             limit: Maximum number of issues
+            truncate_description: Characters of description to keep; 0 skips fetching it
 
         Returns:
             List of issues
         """
-        filter_str = ""
-        if state:
-            filter_str = f'filter: {{state: {{name: {{eq: "{state}"}}}}}}, '
-
-        query = f"""
-        query {{
-            viewer {{
-                assignedIssues({filter_str}first: {limit}) {{
-                    nodes {{
-                        id
-                        identifier
-                        title
-                        description
-                        priority
-                        createdAt
-                        updatedAt
-                        state {{
-                            name
-                            color
-                        }}
-                        project {{
-                            name
-                        }}
-                        team {{
-                            name
-                        }}
-                        labels {{
-                            nodes {{
-                                name
-                                color
-                            }}
-                        }}
-                    }}
-                }}
-            }}
-        }}
-        """
-
-        data = self._query(query)
-        issues = data.get("viewer", {}).get("assignedIssues", {}).get("nodes", [])
+        issues = self.iter_my_issues(
+            state=state,
+            page_size=min(limit, MAX_PAGE_SIZE),
+            truncate_description=truncate_description,
+        )
+        return list(islice(issues, limit))
 
-        return [
-            {
-                "id": i.get("identifier"),
-                "title": i.get("title"),
-                "description": (i.get("description") or "")[:200],
-                "priority": i.get("priority"),
-                "state": i.get("state", {}).get("name"),
-                "project": i.get("project", {}).get("name") if i.get("project") else None,
-                "team": i.get("team", {}).get("name"),
-                "labels": [l.get("name") for l in i.get("labels", {}).get("nodes", [])],
-                "created_at": i.get("createdAt"),
-                "updated_at": i.get("updatedAt"),
-            }
-            for i in issues
-        ]
+    def iter_my_issues(
+        self,
+        state: Optional[str] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        truncate_description: int = 200,
+    ) -> Iterator[Issue]:
+        """Iterate over issues assigned to the authenticated user, fetching further pages on demand."""
+        filters = {"state": {"name": {"eq": state}}} if state else None
+
+        issues = self._paginate(
+            _ASSIGNED_ISSUES_QUERY,
+            ("viewer", "assignedIssues"),
+            variables={"filter": filters, "withDescription": truncate_description > 0},
+            page_size=page_size,
+        )
+        return (_format_issue(i, truncate_description) for i in issues)
 
     def get_my_activity(
         self,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
         limit: int = 50,
-    ) -> list[dict]:
+    ) -> list[Activity]:
         """
         Get recent activity/issues I've worked on.
 
@@ -222,193 +637,73 @@ class LinearMCPServer:
         Returns:
             List of recently updated issues
         """
-        filter_parts = []
-        if start_date:
-            filter_parts.append(f'updatedAt: {{gte: "{start_date.isoformat()}"}}')
-        if end_date:
-            filter_parts.append(f'updatedAt: {{lte: "{end_date.isoformat()}"}}')
-
-        filter_str = ""
-        if filter_parts:
-            filter_str = f"filter: {{{', '.join(filter_parts)}}}, "
-
-        query = f"""
-        query {{
-            viewer {{
-                assignedIssues({filter_str}first: {limit}, orderBy: updatedAt) {{
-                    nodes {{
-                        id
-                        identifier
-                        title
-                        state {{
-                            name
-                        }}
-                        updatedAt
-                        team {{
-                            name
-                        }}
-                    }}
-                }}
-            }}
-        }}
-        """
+        issues = self.iter_my_activity(
+            start_date=start_date,
+            end_date=end_date,
+            page_size=min(limit, MAX_PAGE_SIZE),
+        )
+        return list(islice(issues, limit))
 
-        data = self._query(query)
-        issues = data.get("viewer", {}).get("assignedIssues", {}).get("nodes", [])
+    def iter_my_activity(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        page_size: int = MAX_PAGE_SIZE,
+    ) -> Iterator[Activity]:
+        """Iterate over recently updated issues, fetching further pages on demand."""
+        updated_at = _date_range(start_date, end_date)
+        filters = {"updatedAt": updated_at} if updated_at else None
+
+        issues = self._paginate(
+            _ACTIVITY_QUERY,
+            ("viewer", "assignedIssues"),
+            variables={"filter": filters},
+            page_size=page_size,
+        )
+        return map(_format_activity, issues)
 
-        return [
-            {
-                "id": i.get("identifier"),
-                "title": i.get("title"),
-                "state": i.get("state", {}).get("name"),
-                "team": i.get("team", {}).get("name"),
-                "updated_at": i.get("updatedAt"),
-            }
-            for i in issues
-        ]
+    @ttl_cache(ttl=TEAMS_CACHE_TTL)
+    def get_teams(self, include_members: bool = False) -> list[dict]:
+        """
+        Get all teams in the workspace.
 
-    def get_teams(self) -> list[dict]:
-        """Get all teams in the workspace."""
-        query = """
-        query {
-            teams {
-                nodes {
-                    id
-                    name
-                    key
-                    description
-                    members {
-                        nodes {
-                            id
-                            name
-                            email
-                        }
-                    }
-                }
-            }
-        }
+        Args:
+            include_members: Also fetch each team's member list
+
+        Returns:
+            List of teams
         """
+        cache_key = f"{self.api_key}:{include_members}"
+        cached = cache_get("linear_teams", cache_key)
+        if cached is not None:
+            return cached
 
-        data = self._query(query)
-        teams = data.get("teams", {}).get("nodes", [])
+        data = self._query(_TEAMS_QUERY, {"includeMembers": include_members})
+        result = [_format_team(t, include_members) for t in data.get("teams", {}).get("nodes", [])]
 
-        return [
-            {
-                "id": t.get("id"),
-                "name": t.get("name"),
-                "key": t.get("key"),
-                "description": t.get("description"),
-                "members": [
-                    {"name": m.get("name"), "email": m.get("email")}
-                    for m in t.get("members", {}).get("nodes", [])
-                ],
-            }
-            for t in teams
-        ]
+        cache_set("linear_teams", cache_key, result, TEAMS_CACHE_TTL)
+        return result
 
-    def get_projects(self, team_key: Optional[str] = None, include_completed: bool = False) -> list[dict]:
+    def get_projects(
+        self,
+        team_key: Optional[str] = None,
+        include_completed: bool = False,
+        profile: str = "full",
+    ) -> list[dict]:
         """
         Get projects with their latest status/health updates.
 
         Args:
             team_key: Filter by team key (e.g., 'ENG')
             include_completed: Include completed/canceled projects
+            profile: Selection profile ('full' or 'table'); fields outside it come back empty
 
         Returns:
             List of projects sorted by last status update
         """
-        filter_parts = []
-        if team_key:
-            filter_parts.append(f'accessibleTeams: {{key: {{eq: "{team_key}"}}}}')
-        if not include_completed:
-            # Only include active projects (not completed or canceled)
-            filter_parts.append('state: {nin: ["completed", "canceled"]}')
-
-        filter_str = ""
-        if filter_parts:
-            filter_str = f"filter: {{{', '.join(filter_parts)}}}, "
-
-        query = f"""
-        query {{
-            projects({filter_str}first: 100, orderBy: updatedAt) {{
-                nodes {{
-                    id
-                    name
-                    description
-                    state
-                    progress
-                    health
-                    targetDate
-                    startDate
-                    updatedAt
-                    createdAt
-                    lead {{
-                        name
-                    }}
-                    teams {{
-                        nodes {{
-                            name
-                            key
-                        }}
-                    }}
-                    projectUpdates(first: 10, orderBy: createdAt) {{
-                        nodes {{
-                            id
-                            body
-                            health
-                            createdAt
-                            user {{
-                                name
-                            }}
-                        }}
-                    }}
-                }}
-            }}
-        }}
-        """
-
-        data = self._query(query)
-        projects = data.get("projects", {}).get("nodes", [])
-
-        result = []
-        for p in projects:
-            # Get all project updates
-            updates = p.get("projectUpdates", {}).get("nodes", [])
-            latest_update = updates[0] if updates else None
-
-            # Find the most recent update that has a health value
-            latest_health_update = None
-            for update in updates:
-                if update.get("health"):
-                    latest_health_update = update
-                    break  # Already sorted by createdAt desc, so first match is most recent
-
-            result.append({
-                "id": p.get("id"),
-                "name": p.get("name"),
-                "description": (p.get("description") or "")[:200],
-                "state": p.get("state"),
-                "progress": p.get("progress"),
-                "health": p.get("health"),
-                "target_date": p.get("targetDate"),
-                "start_date": p.get("startDate"),
-                "updated_at": p.get("updatedAt"),
-                "created_at": p.get("createdAt"),
-                "lead": p.get("lead", {}).get("name") if p.get("lead") else None,
-                "teams": [t.get("name") for t in p.get("teams", {}).get("nodes", [])],
-                "latest_update": {
-                    "body": (latest_update.get("body") or "")[:200] if latest_update else None,
-                    "health": latest_update.get("health") if latest_update else None,
-                    "created_at": latest_update.get("createdAt") if latest_update else None,
-                    "author": latest_update.get("user", {}).get("name") if latest_update else None,
-                } if latest_update else None,
-                # Use the health update timestamp for sorting, fallback to any update, then project update
-                "health_updated_at": latest_health_update.get("createdAt") if latest_health_update else None,
-                "latest_health": latest_health_update.get("health") if latest_health_update else None,
-                "status_updated_at": latest_update.get("createdAt") if latest_update else p.get("updatedAt"),
-            })
-
-        return result
+        query = _PROJECTS_QUERIES[profile]
+        data = self._query(query, {"filter": _project_filter(team_key, include_completed)})
+        return [_format_project(p) for p in data.get("projects", {}).get("nodes", [])]
 
     def search_issues(self, query_text: str, limit: int = 20) -> list[dict]:
         """
@@ -421,30 +716,8 @@ class LinearMCPServer:
         Returns:
             List of matching issues
         """
-        query = """
-        query($query: String!, $limit: Int!) {
-            searchIssues(query: $query, first: $limit) {
-                nodes {
-                    id
-                    identifier
-                    title
-                    description
-                    state {
-                        name
-                    }
-                    team {
-                        name
-                    }
-                    assignee {
-                        name
-                    }
-                }
-            }
-        }
-        """
-
         variables = {"query": query_text, "limit": limit}
-        data = self._query(query, variables)
+        data = self._query(_SEARCH_QUERY, variables)
         issues = data.get("searchIssues", {}).get("nodes", [])
 
         return [
@@ -459,40 +732,76 @@ class LinearMCPServer:
             for i in issues
         ]
 
+    @ttl_cache(ttl=VIEWER_CACHE_TTL)
     def get_viewer(self) -> dict:
         """Get information about the authenticated user."""
-        query = """
-        query {
-            viewer {
-                id
-                name
-                email
-                admin
-                organization {
-                    name
-                    urlKey
-                }
-            }
-        }
+        data = self._query(_VIEWER_QUERY)
+        return _format_viewer(data.get("viewer", {}))
+
+    def batch_fetch(
+        self,
+        viewer: bool = False,
+        teams: bool = False,
+        include_members: bool = False,
+        projects: Optional[dict] = None,
+    ) -> dict:
         """
+        Fetch several workspace resources in a single GraphQL request.
 
-        data = self._query(query)
-        viewer = data.get("viewer", {})
+        Args:
+            viewer: Include the authenticated user
+            teams: Include all teams
+            include_members: Include team member lists (with teams)
+            projects: get_projects keyword arguments, e.g. {"include_completed": False, "profile": "table"}
 
-        return {
-            "id": viewer.get("id"),
-            "name": viewer.get("name"),
-            "email": viewer.get("email"),
-            "is_admin": viewer.get("admin"),
-            "organization": viewer.get("organization", {}).get("name"),
-            "org_url": viewer.get("organization", {}).get("urlKey"),
-        }
+        Returns:
+            Dict with a "viewer", "teams" and/or "projects" entry, formatted
+            as by the matching single-resource method
+        """
+        variables = {}
+        definitions = []
+        fields = []
+        if viewer:
+            fields.append("viewer {" + _VIEWER_FIELDS + "}")
+        if teams:
+            definitions.append("$includeMembers: Boolean!")
+            variables["includeMembers"] = include_members
+            fields.append("teams { nodes {" + _TEAM_FIELDS + "} }")
+        if projects is not None:
+            definitions.append("$projectFilter: ProjectFilter")
+            variables["projectFilter"] = _project_filter(
+                projects.get("team_key"), projects.get("include_completed", False)
+            )
+            fields.append(
+                "projects(filter: $projectFilter, first: 100, orderBy: updatedAt) { nodes {"
+                + _LINEAR_SELECTION_PROFILES[projects.get("profile", "full")] + "} }"
+            )
+        if not fields:
+            return {}
+
+        signature = f"({', '.join(definitions)})" if definitions else ""
+        data = self._query(f"query Batch{signature} {{ {' '.join(fields)} }}", variables)
+
+        result = {}
+        if viewer:
+            result["viewer"] = _format_viewer(data.get("viewer", {}))
+        if teams:
+            result["teams"] = [_format_team(t, include_members) for t in data.get("teams", {}).get("nodes", [])]
+        if projects is not None:
+            result["projects"] = [_format_project(p) for p in data.get("projects", {}).get("nodes", [])]
+        return result
+
+
+@lru_cache(maxsize=4)
+def get_linear_server(api_key: str) -> LinearMCPServer:
+    """Get a shared LinearMCPServer for an API key."""
+    return LinearMCPServer(api_key)
 
 
 def test_linear_connection(api_key: str) -> bool:
     """Test if Linear connection is working."""
     try:
-        server = LinearMCPServer(api_key)
+        server = get_linear_server(api_key)
         viewer = server.get_viewer()
         return bool(viewer.get("id"))
     except Exception:
@@ -502,7 +811,7 @@ def test_linear_connection(api_key: str) -> bool:
 def get_linear_user_info(api_key: str) -> Optional[dict]:
     """Get info about the authenticated Linear user."""
     try:
-        server = LinearMCPServer(api_key)
+        server = get_linear_server(api_key)
         return server.get_viewer()
     except Exception:
         return None
@@ -1,30 +1,37 @@
 """
 Data source integrations for Worklog CLI.
+
+Integrations are imported on first access so a command only loads the
+sources (and their client libraries) it actually uses.
 """
 
-from sources.gcalendar import get_calendar_events, test_calendar_connection
-from sources.chrome import get_chrome_history, test_chrome_access
-from sources.github import get_github_commits, test_github_connection
-from sources.slack import get_slack_messages, test_slack_connection, get_slack_user_info
-from sources.linear import (
-    get_linear_activity,
-    get_linear_audit_logs,
-    test_linear_connection,
-    get_linear_user_info,
-)
+import importlib
+
+# Exported name -> module that defines it
+_EXPORTS = {
+    "get_calendar_events": "sources.gcalendar",
+    "test_calendar_connection": "sources.gcalendar",
+    "get_chrome_history": "sources.chrome",
+    "test_chrome_access": "sources.chrome",
+    "clear_chrome_cache": "sources.chrome",
+    "get_github_commits": "sources.github",
+    "test_github_connection": "sources.github",
+    "get_slack_messages": "sources.slack",
+    "test_slack_connection": "sources.slack",
+    "get_slack_user_info": "sources.slack",
+    "get_linear_activity": "sources.linear",
+    "get_linear_audit_logs": "sources.linear",
+    "test_linear_connection": "sources.linear",
+    "get_linear_user_info": "sources.linear",
+}
+
+__all__ = list(_EXPORTS)
+
 
-__all__ = [
-    "get_calendar_events",
-    "test_calendar_connection",
-    "get_chrome_history",
-    "test_chrome_access",
-    "get_github_commits",
-    "test_github_connection",
-    "get_slack_messages",
-    "test_slack_connection",
-    "get_slack_user_info",
-    "get_linear_activity",
-    "get_linear_audit_logs",
-    "test_linear_connection",
-    "get_linear_user_info",
-]
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
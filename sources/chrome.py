@@ -3,14 +3,70 @@ Chrome browser history integration for Worklog CLI.
 Reads directly from Chrome's local SQLite database.
 """
 
+import os
 import platform
+import re
 import shutil
 import sqlite3
 import tempfile
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+from config import CACHE_DIR, ensure_config_dir
+
+# Chrome epoch is Jan 1, 1601; Unix epoch is Jan 1, 1970. Offset in microseconds.
+CHROME_EPOCH_OFFSET_US = 11_644_473_600 * 1_000_000
+
+# Most visits read per query, newest first
+MAX_HISTORY_ROWS = 10_000
+
+# Seconds before the local visit cache (~/.worklog/cache/chrome_<profile>.sqlite)
+# is dropped and rebuilt, so titles Chrome rewrote after the visit was cached do
+# not linger
+VISIT_CACHE_TTL = 7 * 24 * 60 * 60
+
+# Microseconds of already-cached history re-read on each refresh, picking up
+# visits Chrome had not yet written to disk when the cache last read it
+REFRESH_OVERLAP_US = 24 * 60 * 60 * 1_000_000
+
+# Visits with a title, excluding internal chrome pages, within an inclusive
+# visit_time range, newest first; a negative limit means no limit
+_VISITS_QUERY = """
+    SELECT
+        urls.url,
+        urls.title,
+        visits.visit_time
+    FROM urls
+    JOIN visits ON urls.id = visits.url
+    WHERE visits.visit_time BETWEEN ? AND ?
+        -- Skip empty titles and internal chrome pages
+        AND urls.title IS NOT NULL AND urls.title <> ''
+        AND urls.url NOT LIKE 'chrome://%'
+        AND urls.url NOT LIKE 'chrome-extension://%'
+    ORDER BY visits.visit_time DESC
+    LIMIT ?
+"""
+
+_CACHE_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS visits (
+        url TEXT NOT NULL,
+        title TEXT NOT NULL,
+        visit_time INTEGER NOT NULL,
+        PRIMARY KEY (visit_time, url)
+    );
+    CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL);
+"""
+
+# Read-only tuning: memory-map the file and use a 64 MB page cache
+_PRAGMAS = (
+    "PRAGMA query_only = 1",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA mmap_size = 268435456",
+    "PRAGMA cache_size = -65536",
+)
+
 
 def get_chrome_history_path(profile: str = "Default") -> Path:
     """Get the path to Chrome's history database based on OS."""
@@ -31,27 +87,37 @@ def chrome_time_to_datetime(chrome_time: int) -> datetime:
     Convert Chrome's timestamp format to Python datetime.
     Chrome uses microseconds since Jan 1, 1601.
     """
-    # Chrome epoch is Jan 1, 1601. Unix epoch is Jan 1, 1970.
-    # Difference is 11644473600 seconds
     if chrome_time == 0:
         return datetime.min
 
-    seconds = (chrome_time / 1_000_000) - 11644473600
+    # Shift epochs in integer microseconds, then convert to seconds once
     try:
-        return datetime.fromtimestamp(seconds)
+        return datetime.fromtimestamp((chrome_time - CHROME_EPOCH_OFFSET_US) / 1_000_000)
     except (OSError, ValueError):
         return datetime.min
 
 
+def datetime_to_chrome_time(dt: datetime) -> int:
+    """Convert a Python datetime to Chrome's timestamp format."""
+    return int(dt.timestamp() * 1_000_000) + CHROME_EPOCH_OFFSET_US
+
+
 def get_chrome_history(
     start: datetime,
     end: datetime,
-    chrome_profile: Optional[str] = "Default"
+    chrome_profile: Optional[str] = "Default",
+    max_rows: int = MAX_HISTORY_ROWS,
+    use_cache: bool = True,
 ) -> list[dict]:
     """
-    Fetch Chrome browsing history for a given date range.
+    Fetch Chrome browsing history for a given date range, newest first,
+    reading at most max_rows visits.
+
+    Visits are served from a local cache under ~/.worklog/cache that only reads
+    rows newer than its latest entry from Chrome.
 
-    Note: Chrome locks its database while running, so we copy it first.
+    Note: Chrome locks its database while running, so it is opened as an
+    immutable file, falling back to a private copy if that fails.
     """
     profile = chrome_profile or "Default"
     history_path = get_chrome_history_path(profile)
@@ -59,71 +125,181 @@ def get_chrome_history(
     if not history_path.exists():
         raise FileNotFoundError(f"Chrome history not found at {history_path}")
 
-    # Copy the database to a temp file (Chrome locks the original)
-    temp_dir = tempfile.mkdtemp()
-    temp_db = Path(temp_dir) / "History"
+    start_chrome = datetime_to_chrome_time(start)
+    end_chrome = datetime_to_chrome_time(end)
 
-    try:
-        shutil.copy2(history_path, temp_db)
-    except PermissionError:
-        raise PermissionError(
-            "Cannot access Chrome history. Please close Chrome and try again."
-        )
+    if not use_cache:
+        # Opting out also deletes the copy of the history kept so far
+        clear_chrome_cache(profile)
+        rows = _read_visits(history_path, start_chrome, end_chrome, max_rows)
+    else:
+        try:
+            rows = _cached_visits(profile, history_path, start_chrome, end_chrome, max_rows)
+        except (sqlite3.Error, OSError):
+            # An unusable cache only costs speed; read Chrome's database directly
+            rows = _read_visits(history_path, start_chrome, end_chrome, max_rows)
 
-    # Convert datetime to Chrome timestamp format
-    def to_chrome_time(dt: datetime) -> int:
-        return int((dt.timestamp() + 11644473600) * 1_000_000)
+    history = []
+    for url, title, visit_time in rows:
+        visit_dt = chrome_time_to_datetime(visit_time)
 
-    start_chrome = to_chrome_time(start)
-    end_chrome = to_chrome_time(end)
+        history.append({
+            "url": url,
+            "title": title,
+            # Formatted here so rendering a row is plain lookups
+            "date": f"{visit_dt.year:04d}-{visit_dt.month:02d}-{visit_dt.day:02d}",
+            "time": f"{visit_dt.hour:02d}:{visit_dt.minute:02d}",
+        })
 
-    history = []
+    return history
+
+
+def _read_visits(history_path: Path, low: int, high: int, limit: int = -1) -> list[tuple]:
+    """
+    Read (url, title, visit_time) rows from Chrome's database, newest first.
+
+    While Chrome has no write in flight the live file is queried in immutable
+    read-only mode (no locks, no copy). A non-empty journal or WAL means a
+    write is under way, and immutable mode would read torn pages, so the query
+    then runs against a private copy, as it does when the immutable read fails.
+    """
+    if not _write_pending(history_path):
+        try:
+            conn = sqlite3.connect(f"{history_path.as_uri()}?mode=ro&immutable=1", uri=True)
+            try:
+                return _tune(conn).execute(_VISITS_QUERY, (low, high, limit)).fetchall()
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            pass
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        conn = _copy_history(history_path, Path(temp_dir) / "History")
+        try:
+            return conn.execute(_VISITS_QUERY, (low, high, limit)).fetchall()
+        finally:
+            conn.close()
+
+
+def _write_pending(history_path: Path) -> bool:
+    """
+    Whether a non-empty journal or WAL sits next to Chrome's history database.
+
+    Chrome keeps History in TRUNCATE journal mode, which leaves a zero-byte
+    History-journal in place between writes; only content means a write is open.
+    """
+    for suffix in ("-journal", "-wal"):
+        try:
+            if history_path.with_name(history_path.name + suffix).stat().st_size > 0:
+                return True
+        except FileNotFoundError:
+            pass
+    return False
 
+
+def _cached_visits(profile: str, history_path: Path, low: int, high: int, limit: int) -> list[tuple]:
+    """
+    Serve visits from a local per-profile cache, reading only new rows from Chrome.
+
+    Past visits rarely change, so the cache remembers the earliest visit_time
+    it covers and the newest row it holds; each call reads just the visits newer
+    than that row, plus any older range that was not covered yet. The refreshed
+    window is replaced rather than merged, so visits deleted in Chrome leave the
+    cache there too.
+    """
+    ensure_config_dir()
+    CACHE_DIR.mkdir(mode=0o700, exist_ok=True)
+    cache_path = _visit_cache_path(profile)
+
+    conn = sqlite3.connect(str(cache_path))
     try:
-        conn = sqlite3.connect(str(temp_db))
-        cursor = conn.cursor()
-
-        # Query for URLs visited in the time range
-        query = """
-            SELECT
-                urls.url,
-                urls.title,
-                visits.visit_time
-            FROM urls
-            JOIN visits ON urls.id = visits.url
-            WHERE visits.visit_time >= ? AND visits.visit_time <= ?
-            ORDER BY visits.visit_time DESC
-        """
-
-        cursor.execute(query, (start_chrome, end_chrome))
-
-        for row in cursor.fetchall():
-            url, title, visit_time = row
-
-            # Skip empty titles and internal chrome pages
-            if not title or url.startswith("chrome://") or url.startswith("chrome-extension://"):
-                continue
-
-            visit_dt = chrome_time_to_datetime(visit_time)
-
-            history.append({
-                "url": url,
-                "title": title,
-                "time": visit_dt.strftime("%H:%M"),
-                "datetime": visit_dt,
-            })
+        os.chmod(cache_path, 0o600)
+        conn.executescript(_CACHE_SCHEMA)
+        meta = dict(conn.execute("SELECT key, value FROM meta"))
+        # One clock read serves the expiry check, the rebuild stamp and the refresh bound
+        now = time.time()
+
+        with conn:
+            if meta.get("built_at", 0) + VISIT_CACHE_TTL < now:
+                conn.execute("DELETE FROM visits")
+                meta = {"built_at": int(now), "covered_from": low}
+                newest = low - 1
+            else:
+                newest = conn.execute("SELECT MAX(visit_time) FROM visits").fetchone()[0]
+                if newest is None:
+                    newest = meta["covered_from"] - 1
+                if low < meta["covered_from"]:
+                    conn.executemany(
+                        "INSERT OR IGNORE INTO visits VALUES (?, ?, ?)",
+                        _read_visits(history_path, low, meta["covered_from"] - 1),
+                    )
+                    meta["covered_from"] = low
 
+            refresh_low = newest + 1 - REFRESH_OVERLAP_US
+            refresh_high = int(now * 1_000_000) + CHROME_EPOCH_OFFSET_US
+            fresh = _read_visits(history_path, refresh_low, refresh_high)
+            conn.execute("DELETE FROM visits WHERE visit_time BETWEEN ? AND ?", (refresh_low, refresh_high))
+            conn.executemany("INSERT OR IGNORE INTO visits VALUES (?, ?, ?)", fresh)
+            conn.executemany("INSERT OR REPLACE INTO meta VALUES (?, ?)", meta.items())
+
+        return conn.execute(
+            "SELECT url, title, visit_time FROM visits"
+            " WHERE visit_time BETWEEN ? AND ? ORDER BY visit_time DESC LIMIT ?",
+            (low, high, limit),
+        ).fetchall()
+    finally:
         conn.close()
 
+
+def _visit_cache_path(profile: str) -> Path:
+    """Path of the local visit cache for a Chrome profile."""
+    return CACHE_DIR / f"chrome_{re.sub(r'[^A-Za-z0-9]+', '_', profile)}.sqlite"
+
+
+def clear_chrome_cache(profile: Optional[str] = None):
+    """Delete the local visit cache for a profile, or for every profile."""
+    pattern = f"{_visit_cache_path(profile).name}*" if profile else "chrome_*.sqlite*"
+    for path in CACHE_DIR.glob(pattern):
+        path.unlink(missing_ok=True)
+
+
+def _copy_history(history_path: Path, temp_db: Path) -> sqlite3.Connection:
+    """
+    Copy Chrome's history database into temp_db and open the copy.
+
+    Tries a page-wise backup first, which sees a consistent snapshot even while
+    Chrome writes, then a plain file copy. Chrome's own visits_time_index comes
+    along and serves the range scan.
+    """
+    uri = history_path.as_uri()
+
+    src = dst = None
+    try:
+        src = sqlite3.connect(f"{uri}?mode=ro", uri=True)
+        dst = sqlite3.connect(str(temp_db))
+        src.backup(dst, pages=100)
+        return _tune(dst)
+    except sqlite3.Error:
+        if dst is not None:
+            dst.close()
     finally:
-        # Clean up temp file
-        try:
-            Path(temp_db).unlink()
-            Path(temp_dir).rmdir()
-        except Exception:
-            pass
+        if src is not None:
+            src.close()
 
-    return history
+    try:
+        shutil.copy2(history_path, temp_db)
+    except PermissionError:
+        raise PermissionError(
+            "Cannot access Chrome history. Please close Chrome and try again."
+        )
+    return _tune(sqlite3.connect(str(temp_db)))
+
+
+def _tune(conn: sqlite3.Connection) -> sqlite3.Connection:
+    """Apply read-only performance pragmas to a history connection."""
+    for pragma in _PRAGMAS:
+        conn.execute(pragma)
+    return conn
 
 
 def test_chrome_access(profile: Optional[str] = "Default") -> bool:
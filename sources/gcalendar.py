@@ -2,8 +2,11 @@
 Google Calendar integration for Worklog CLI.
 """
 
+import hashlib
 import os
-from datetime import datetime
+import threading
+from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -11,6 +14,11 @@ from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+
+from utils.cache import cache_get, cache_set
+from utils.dates import parse_iso_datetime
+from utils.serialization import loads_json
 
 # If modifying these scopes, delete the token file.
 SCOPES = ["https://www.googleapis.com/auth/calendar.readonly"]
@@ -19,6 +27,21 @@ CONFIG_DIR = Path.home() / ".worklog"
 CREDENTIALS_FILE = CONFIG_DIR / "google_credentials.json"
 TOKEN_FILE = CONFIG_DIR / "google_token.json"
 
+# Seconds cached events stay fresh; past days rarely change
+TODAY_CACHE_TTL = 5 * 60
+PAST_CACHE_TTL = 24 * 60 * 60
+
+# Seconds a response ETag is kept for conditional re-fetches
+ETAG_CACHE_TTL = 7 * 24 * 60 * 60
+
+# Calendar service per thread, reused while the access token is unchanged; a
+# service wraps one httplib2.Http, which must not be shared between threads
+_SERVICE = threading.local()
+
+# Parsed timestamps keyed by raw string; recurring events repeat the same times
+_DT_CACHE: dict[str, datetime] = {}
+_DT_CACHE_MAX = 1024
+
 
 def get_credentials() -> Optional[Credentials]:
     """Get or refresh Google OAuth credentials."""
@@ -50,24 +73,52 @@ def get_credentials() -> Optional[Credentials]:
 
 def get_calendar_events(config: dict, start: datetime, end: datetime) -> list[dict]:
     """Fetch calendar events for a given date range."""
+    # Keyed by account so switching Google accounts or re-running setup never
+    # serves another account's events
+    account = _account_key()
+    cache_key = f"{account}:{start.isoformat()}:{end.isoformat()}"
+    if account:
+        cached = cache_get("gcal", cache_key)
+        if cached is not None:
+            return cached
+
     creds = get_credentials()
     if not creds:
         return []
 
-    service = build("calendar", "v3", credentials=creds)
+    if not account:
+        # First sign-in just wrote the token file
+        cache_key = f"{_account_key()}:{start.isoformat()}:{end.isoformat()}"
+
+    service = _get_service(creds)
 
     # Convert to RFC3339 format
     time_min = start.isoformat() + "Z"
     time_max = end.isoformat() + "Z"
 
-    events_result = service.events().list(
+    request = service.events().list(
         calendarId="primary",
         timeMin=time_min,
         timeMax=time_max,
         maxResults=50,
         singleEvents=True,
         orderBy="startTime"
-    ).execute()
+    )
+
+    ttl = TODAY_CACHE_TTL if end.date() >= date.today() else PAST_CACHE_TTL
+
+    # Revalidate the last response for this range instead of re-downloading it
+    validator = cache_get("gcal_etag", cache_key)
+    if validator:
+        request.headers["If-None-Match"] = validator["etag"]
+
+    try:
+        events_result = request.execute()
+    except HttpError as e:
+        if validator and e.resp.status == 304:
+            cache_set("gcal", cache_key, validator["events"], ttl)
+            return validator["events"]
+        raise
 
     events = events_result.get("items", [])
 
@@ -78,9 +129,9 @@ def get_calendar_events(config: dict, start: datetime, end: datetime) -> list[di
 
         # Parse times
         if "T" in start_time:
-            start_dt = datetime.fromisoformat(start_time.replace("Z", "+00:00"))
-            end_dt = datetime.fromisoformat(end_time.replace("Z", "+00:00"))
-            time_str = start_dt.strftime("%H:%M") + " - " + end_dt.strftime("%H:%M")
+            start_dt = _parse_iso(start_time)
+            end_dt = _parse_iso(end_time)
+            time_str = f"{start_dt.hour:02d}:{start_dt.minute:02d} - {end_dt.hour:02d}:{end_dt.minute:02d}"
             duration = end_dt - start_dt
             duration_str = format_duration(duration.total_seconds())
         else:
@@ -88,6 +139,8 @@ def get_calendar_events(config: dict, start: datetime, end: datetime) -> list[di
             duration_str = "All day"
 
         formatted_events.append({
+            # Both "YYYY-MM-DD" and RFC 3339 start with the event's local date
+            "date": start_time[:10],
             "time": time_str,
             "summary": event.get("summary", "(No title)"),
             "duration": duration_str,
@@ -95,9 +148,46 @@ def get_calendar_events(config: dict, start: datetime, end: datetime) -> list[di
             "location": event.get("location", ""),
         })
 
+    cache_set("gcal", cache_key, formatted_events, ttl)
+    if events_result.get("etag"):
+        cache_set("gcal_etag", cache_key, {"etag": events_result["etag"], "events": formatted_events}, ETAG_CACHE_TTL)
     return formatted_events
 
 
+def _account_key() -> str:
+    """Identify the signed-in account from the token file; empty if there is none."""
+    try:
+        with open(TOKEN_FILE, "rb") as f:
+            token = loads_json(f.read())
+    except (OSError, ValueError):
+        return ""
+    # The refresh token is unique to the user's grant; hash it rather than keep it in cache keys
+    identity = f"{token.get('client_id', '')}:{token.get('refresh_token', '')}"
+    return hashlib.sha256(identity.encode()).hexdigest()[:16]
+
+
+def _get_service(creds: Credentials):
+    """Build this thread's Calendar service once per access token from the bundled discovery document."""
+    if getattr(_SERVICE, "service", None) is None or _SERVICE.token != creds.token:
+        _SERVICE.service = build(
+            "calendar", "v3", credentials=creds, cache_discovery=False, static_discovery=True
+        )
+        _SERVICE.token = creds.token
+    return _SERVICE.service
+
+
+def _parse_iso(value: str) -> datetime:
+    """Parse an RFC 3339 timestamp, reusing earlier results for the same string."""
+    parsed = _DT_CACHE.get(value)
+    if parsed is None:
+        if len(_DT_CACHE) >= _DT_CACHE_MAX:
+            _DT_CACHE.clear()
+        parsed = parse_iso_datetime(value)
+        _DT_CACHE[value] = parsed
+    return parsed
+
+
+@lru_cache(maxsize=256)
 def format_duration(seconds: float) -> str:
     """Format duration in seconds to human-readable string."""
     hours = int(seconds // 3600)
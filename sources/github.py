@@ -3,16 +3,43 @@ GitHub integration for Worklog CLI.
 Fetches commits made by the user across all their repositories.
 """
 
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
 from typing import Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
+from utils.cache import cache_get, cache_set
+from utils.dates import parse_iso_datetime
+from utils.serialization import dumps_json, loads_json
 
-def get_github_commits(config: dict, start: datetime, end: datetime) -> list[dict]:
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+
+# Concurrent commit-detail requests; kept low to stay under GitHub's secondary rate limit
+MAX_WORKERS = 10
+
+# Pages of user events the GitHub API will serve
+EVENT_PAGES = 10
+
+# Event pages requested together once page 1 shows older events are needed
+EVENT_PREFETCH = 2
+
+# Seconds a response ETag is kept for conditional re-fetches
+ETAG_CACHE_TTL = 7 * 24 * 60 * 60
+
+# Seconds cached commits stay fresh; past days rarely change
+TODAY_CACHE_TTL = 5 * 60
+PAST_CACHE_TTL = 24 * 60 * 60
+
+
+def get_github_commits(config: dict, start: datetime, end: datetime, include_stats: bool = True) -> list[dict]:
     """
     Fetch GitHub commits for a given date range.
     Uses the GitHub Events API and Search API to find user's commits.
+
+    Line-change stats cost extra requests; with include_stats=False they are
+    not fetched and "changes" is left empty.
     """
     token = config.get("github_token")
     username = config.get("github_username")
@@ -20,16 +47,13 @@ def get_github_commits(config: dict, start: datetime, end: datetime) -> list[dic
     if not token or not username:
         raise ValueError("GitHub token and username not configured. Run 'worklog setup'.")
 
-    headers = {
-        "Authorization": f"token {token}",
-        "Accept": "application/vnd.github.v3+json",
-    }
-
-    commits = []
-
-    # Format dates for GitHub API
-    start_str = start.strftime("%Y-%m-%dT%H:%M:%SZ")
-    end_str = end.strftime("%Y-%m-%dT%H:%M:%SZ")
+    cache_key = f"{token}:{username}:{start.isoformat()}:{end.isoformat()}:{include_stats}"
+    cached = cache_get("github", cache_key)
+    if cached is not None:
+        # Datetimes come back from the JSON cache as ISO strings
+        for commit in cached:
+            commit["datetime"] = parse_iso_datetime(commit["datetime"])
+        return cached
 
     # Method 1: Search API for commits by author
     search_url = "https://api.github.com/search/commits"
@@ -42,68 +66,175 @@ def get_github_commits(config: dict, start: datetime, end: datetime) -> list[dic
         "per_page": 100,
     }
 
+    # One session so the search, every commit detail and event page reuse connections
+    with _new_session(token) as session:
+        commits = _search_commits(session, search_url, params, include_stats)
+
+        # If search didn't work well, fall back to events API
+        if not commits:
+            commits = get_commits_from_events(config, start, end, session)
+
+    # Sort by time
+    commits.sort(key=lambda x: x.get("datetime", datetime.min), reverse=True)
+
+    # Empty results are not cached; a failed search also comes back empty
+    if commits:
+        ttl = TODAY_CACHE_TTL if end.date() >= date.today() else PAST_CACHE_TTL
+        cache_set("github", cache_key, commits, ttl)
+    return commits
+
+
+def _new_session(token: str) -> requests.Session:
+    """Create a keep-alive session authenticated with the GitHub token."""
+    session = requests.Session()
+    session.headers.update({
+        "Authorization": f"token {token}",
+        "Accept": "application/vnd.github.v3+json",
+    })
+    # Room for every concurrent commit-detail request to keep its connection
+    session.mount("https://", HTTPAdapter(pool_maxsize=MAX_WORKERS))
+    return session
+
+
+def _search_commits(session: requests.Session, search_url: str, params: dict, include_stats: bool) -> list[dict]:
+    """Find the user's commits with the search API, optionally with per-commit stats."""
+    commits = []
+
     try:
-        resp = requests.get(
+        resp = session.get(
             search_url,
-            headers={**headers, "Accept": "application/vnd.github.cloak-preview+json"},
+            headers={"Accept": "application/vnd.github.cloak-preview+json"},
             params=params
         )
 
         if resp.status_code == 200:
-            data = resp.json()
-            for item in data.get("items", []):
+            data = loads_json(resp.content)
+            items = [item for item in data.get("items", []) if item.get("commit", {}).get("author", {}).get("date")]
+
+            # Stats for every commit come from one GraphQL query; if that is unavailable,
+            # fall back to one REST request per commit, fetched concurrently.
+            # None entries mean stats were not requested
+            if not include_stats:
+                stats_list = [None] * len(items)
+            else:
+                stats_list = _graphql_commit_stats(session, items) if items else []
+            if stats_list is None:
+                with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(items))) as pool:
+                    stats_list = list(pool.map(lambda item: _commit_stats(session, item.get("url")), items))
+
+            for item, stats in zip(items, stats_list):
+                additions, deletions = stats or (0, 0)
                 commit = item.get("commit", {})
-                author_date = commit.get("author", {}).get("date", "")
-
-                if author_date:
-                    commit_dt = datetime.fromisoformat(author_date.replace("Z", "+00:00"))
-
-                    # Get detailed commit info for stats
-                    commit_url = item.get("url")
-                    additions = 0
-                    deletions = 0
-
-                    if commit_url:
-                        detail_resp = requests.get(commit_url, headers=headers)
-                        if detail_resp.status_code == 200:
-                            detail = detail_resp.json()
-                            stats = detail.get("stats", {})
-                            additions = stats.get("additions", 0)
-                            deletions = stats.get("deletions", 0)
-
-                    # Extract repo name from URL
-                    repo_name = item.get("repository", {}).get("full_name", "unknown")
-
-                    commits.append({
-                        "time": commit_dt.strftime("%H:%M"),
-                        "datetime": commit_dt,
-                        "repo": repo_name,
-                        "message": commit.get("message", "").split("\n")[0],  # First line only
-                        "sha": item.get("sha", "")[:7],
-                        "additions": additions,
-                        "deletions": deletions,
-                        "changes": f"+{additions}/-{deletions}",
-                        "url": item.get("html_url", ""),
-                    })
+                author_date = commit["author"]["date"]
+                commit_dt = parse_iso_datetime(author_date)
+
+                # Extract repo name from URL
+                repo_name = item.get("repository", {}).get("full_name", "unknown")
+
+                commits.append({
+                    "date": f"{commit_dt.year:04d}-{commit_dt.month:02d}-{commit_dt.day:02d}",
+                    "time": f"{commit_dt.hour:02d}:{commit_dt.minute:02d}",
+                    "datetime": commit_dt,
+                    "repo": repo_name,
+                    "message": commit.get("message", "").split("\n")[0],  # First line only
+                    "sha": item.get("sha", "")[:7],
+                    "additions": additions,
+                    "deletions": deletions,
+                    "changes": f"+{additions}/-{deletions}" if stats else "",
+                    "url": item.get("html_url", ""),
+                })
 
     except requests.exceptions.RequestException as e:
         raise ConnectionError(f"Failed to connect to GitHub API: {e}")
 
-    # If search didn't work well, fall back to events API
-    if not commits:
-        commits = get_commits_from_events(config, start, end, headers)
+    return commits
 
-    # Sort by time
-    commits.sort(key=lambda x: x.get("datetime", datetime.min), reverse=True)
 
-    return commits
+def _graphql_commit_stats(session: requests.Session, items: list[dict]) -> Optional[list[tuple[int, int]]]:
+    """
+    Look up (additions, deletions) for many search results in one GraphQL query.
+
+    GraphQL search has no commit type, so each commit is addressed by repository
+    and oid under its own alias. Returns None if the query fails as a whole (e.g.
+    the token cannot use GraphQL); commits that cannot be resolved count as zero.
+    """
+    declarations = []
+    selections = []
+    variables = {}
+    for i, item in enumerate(items):
+        owner, _, name = item.get("repository", {}).get("full_name", "").partition("/")
+        variables.update({f"owner{i}": owner, f"name{i}": name, f"oid{i}": item.get("sha", "")})
+        declarations.append(f"$owner{i}: String!, $name{i}: String!, $oid{i}: GitObjectID!")
+        selections.append(
+            f"c{i}: repository(owner: $owner{i}, name: $name{i}) "
+            f"{{ object(oid: $oid{i}) {{ ... on Commit {{ additions deletions }} }} }}"
+        )
+
+    query = f"query CommitStats({', '.join(declarations)}) {{ {' '.join(selections)} }}"
+    resp = session.post(
+        GITHUB_GRAPHQL_URL,
+        data=dumps_json({"query": query, "variables": variables}).encode(),
+        headers={"Content-Type": "application/json"},
+    )
+    if resp.status_code != 200:
+        return None
+
+    data = loads_json(resp.content).get("data")
+    if not data:
+        return None
+
+    stats = []
+    for i in range(len(items)):
+        commit = (data.get(f"c{i}") or {}).get("object") or {}
+        stats.append((commit.get("additions", 0), commit.get("deletions", 0)))
+    return stats
+
+
+def _commit_stats(session: requests.Session, commit_url: Optional[str]) -> tuple[int, int]:
+    """Fetch (additions, deletions) for one commit; unavailable stats count as zero."""
+    if not commit_url:
+        return 0, 0
+
+    detail = _get_json(session, commit_url)
+    if detail is None:
+        return 0, 0
+
+    stats = detail.get("stats", {})
+    return stats.get("additions", 0), stats.get("deletions", 0)
+
+
+def _get_json(session: requests.Session, url: str, params: Optional[dict] = None):
+    """
+    GET a GitHub API URL as JSON, revalidating an earlier response by its ETag.
+
+    A 304 reply has no body and does not count against the rate limit, so the
+    cached copy is reused. Returns None for any other non-200 status.
+    """
+    cache_key = f"{session.headers.get('Authorization')}:{url}:{sorted((params or {}).items())}"
+    validator = cache_get("github_etag", cache_key)
+
+    resp = session.get(
+        url,
+        params=params,
+        headers={"If-None-Match": validator["etag"]} if validator else None,
+    )
+    if resp.status_code == 304 and validator:
+        return validator["data"]
+    if resp.status_code != 200:
+        return None
+
+    data = loads_json(resp.content)
+    etag = resp.headers.get("ETag")
+    if etag:
+        cache_set("github_etag", cache_key, {"etag": etag, "data": data}, ETAG_CACHE_TTL)
+    return data
 
 
 def get_commits_from_events(
     config: dict,
     start: datetime,
     end: datetime,
-    headers: dict
+    session: requests.Session
 ) -> list[dict]:
     """
     Fallback method: Get commits from GitHub Events API.
@@ -113,55 +244,67 @@ def get_commits_from_events(
     events_url = f"https://api.github.com/users/{username}/events"
 
     commits = []
-    page = 1
-
-    while page <= 10:  # Max 10 pages
-        resp = requests.get(
-            events_url,
-            headers=headers,
-            params={"page": page, "per_page": 100}
-        )
-
-        if resp.status_code != 200:
-            break
-
-        events = resp.json()
-        if not events:
-            break
-
-        for event in events:
-            if event.get("type") != "PushEvent":
-                continue
 
-            created_at = datetime.fromisoformat(event["created_at"].replace("Z", "+00:00"))
+    def fetch_page(page: int):
+        return _get_json(session, events_url, {"page": page, "per_page": 100})
 
-            # Check if within date range
-            if created_at < start.replace(tzinfo=created_at.tzinfo):
-                # Events are sorted by date, so we can stop here
-                return commits
+    # Page 1 alone covers recent ranges, so it is read before anything else
+    events = fetch_page(1)
+    if not events or _collect_push_commits(events, start, end, commits):
+        return commits
 
-            if created_at > end.replace(tzinfo=created_at.tzinfo):
-                continue
+    # Walk the remaining pages in order, a small window at a time, so at most
+    # one page past the stopping point is requested
+    with ThreadPoolExecutor(max_workers=EVENT_PREFETCH) as pool:
+        for first in range(2, EVENT_PAGES + 1, EVENT_PREFETCH):
+            window = range(first, min(first + EVENT_PREFETCH, EVENT_PAGES + 1))
+            for events in pool.map(fetch_page, window):
+                if not events or _collect_push_commits(events, start, end, commits):
+                    return commits
 
-            repo_name = event.get("repo", {}).get("name", "unknown")
-            payload = event.get("payload", {})
-
-            for commit in payload.get("commits", []):
-                commits.append({
-                    "time": created_at.strftime("%H:%M"),
-                    "datetime": created_at,
-                    "repo": repo_name,
-                    "message": commit.get("message", "").split("\n")[0],
-                    "sha": commit.get("sha", "")[:7],
-                    "additions": 0,
-                    "deletions": 0,
-                    "changes": "N/A",
-                    "url": f"https://github.com/{repo_name}/commit/{commit.get('sha', '')}",
-                })
+    return commits
 
-        page += 1
 
-    return commits
+def _collect_push_commits(events: list[dict], start: datetime, end: datetime, commits: list[dict]) -> bool:
+    """
+    Append commits from in-range push events; returns True once an event older
+    than start is reached, since events are sorted newest first.
+    """
+    for event in events:
+        if event.get("type") != "PushEvent":
+            continue
+
+        created_at = parse_iso_datetime(event["created_at"])
+
+        # Check if within date range
+        if created_at < start.replace(tzinfo=created_at.tzinfo):
+            # Events are sorted by date, so we can stop here
+            return True
+
+        if created_at > end.replace(tzinfo=created_at.tzinfo):
+            continue
+
+        repo_name = event.get("repo", {}).get("name", "unknown")
+        payload = event.get("payload", {})
+        # Every commit in a push shares the event's date and time
+        date_str = f"{created_at.year:04d}-{created_at.month:02d}-{created_at.day:02d}"
+        time_str = f"{created_at.hour:02d}:{created_at.minute:02d}"
+
+        for commit in payload.get("commits", []):
+            commits.append({
+                "date": date_str,
+                "time": time_str,
+                "datetime": created_at,
+                "repo": repo_name,
+                "message": commit.get("message", "").split("\n")[0],
+                "sha": commit.get("sha", "")[:7],
+                "additions": 0,
+                "deletions": 0,
+                "changes": "N/A",
+                "url": f"https://github.com/{repo_name}/commit/{commit.get('sha', '')}",
+            })
+
+    return False
 
 
 def test_github_connection(config: dict) -> bool:
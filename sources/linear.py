@@ -3,15 +3,15 @@ Linear integration for Worklog CLI.
 Fetches user activity and audit logs from Linear.
 """
 
-import sys
 from datetime import datetime
-from pathlib import Path
+from itertools import islice
 from typing import Optional
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from mcp.linear import AuditEntry, get_linear_server
+from utils.dates import parse_iso_datetime
 
-from mcp.linear import LinearMCPServer
+# Most recently updated issues reported as activity
+ACTIVITY_LIMIT = 50
 
 
 def get_linear_activity(
@@ -27,20 +27,22 @@ def get_linear_activity(
     if not api_key:
         raise ValueError("Linear API key not configured. Run 'cto setup' first.")
 
-    server = LinearMCPServer(api_key)
-    activity = server.get_my_activity(start_date=start, end_date=end)
+    server = get_linear_server(api_key)
+    activity = islice(server.iter_my_activity(start_date=start, end_date=end, page_size=ACTIVITY_LIMIT), ACTIVITY_LIMIT)
 
-    return [
-        {
-            "id": item["id"],
-            "title": item["title"],
-            "state": item["state"],
-            "team": item["team"],
-            "time": datetime.fromisoformat(item["updated_at"].replace("Z", "+00:00")).strftime("%H:%M") if item.get("updated_at") else "",
-            "datetime": datetime.fromisoformat(item["updated_at"].replace("Z", "+00:00")) if item.get("updated_at") else None,
-        }
-        for item in activity
-    ]
+    results = []
+    for item in activity:
+        # Parse each timestamp once and derive the display time from it
+        updated = parse_iso_datetime(item.updated_at) if item.updated_at else None
+        results.append({
+            "id": item.id,
+            "title": item.title,
+            "state": item.state,
+            "team": item.team,
+            "time": f"{updated.hour:02d}:{updated.minute:02d}" if updated else "",
+            "datetime": updated,
+        })
+    return results
 
 
 def get_linear_audit_logs(
@@ -48,7 +50,7 @@ def get_linear_audit_logs(
     start: datetime,
     end: datetime,
     actor_email: Optional[str] = None,
-) -> list[dict]:
+) -> list[AuditEntry]:
     """
     Fetch Linear audit logs for a given date range.
     Note: Requires admin access and Linear Plus plan.
@@ -57,7 +59,7 @@ def get_linear_audit_logs(
     if not api_key:
         raise ValueError("Linear API key not configured. Run 'cto setup' first.")
 
-    server = LinearMCPServer(api_key)
+    server = get_linear_server(api_key)
 
     try:
         logs = server.get_audit_logs(
@@ -4,9 +4,32 @@ Fetches messages sent by the user within a date range from all conversations.
 """
 
 import requests
-from datetime import datetime
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from itertools import chain
 from typing import Optional
 
+from utils.cache import ttl_cache
+from utils.http import CappedRetry
+from utils.serialization import loads_json
+
+# Seconds to wait for a Slack API response (connect, read)
+REQUEST_TIMEOUT = (5, 30)
+
+# Seconds an auth.test response is reused
+AUTH_CACHE_TTL = 60 * 60
+
+# Seconds a user display name (users.info or users.list) is reused
+USER_CACHE_TTL = 60 * 60
+
+# Concurrent Slack requests; stays within the session's default pool of 10
+MAX_WORKERS = 8
+
+# Concurrent search.messages pages; the method is Tier 2 (about 20 requests a
+# minute), so wider fan-out only trades requests for 429s
+SEARCH_WORKERS = 2
+
 
 def get_slack_messages(
     config: dict,
@@ -31,27 +54,28 @@ def get_slack_messages(
     if not token:
         raise ValueError("Slack token not configured. Run 'cto setup' first.")
 
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json"
-    }
-
     messages = []
-    user_id = _get_user_id(headers)
 
-    # Method 1: Search API (works for searchable content)
-    search_messages = _search_messages(headers, start, end)
-    messages.extend(search_messages)
+    # One session so every API call and cursor page reuses the same connection
+    with _new_session(token) as session:
+        user_id = _get_user_id(token)
+
+        # Method 1: Search API (works for searchable content)
+        search_messages, search_complete = _search_messages(session, start, end)
+        messages.extend(search_messages)
 
-    # Method 2: Direct conversation history (for DMs and private channels)
-    # This catches messages that might not be searchable
-    conversation_messages = _get_conversation_messages(headers, user_id, start, end)
+        # Method 2: Direct conversation history (for DMs and private channels)
+        # This catches messages that might not be searchable. Public channels are
+        # only re-read where search found messages, and only when search provably
+        # covered the whole range; otherwise every conversation is read
+        searched_channels = {msg["channel_id"] for msg in search_messages} if search_complete else None
+        conversation_messages = _get_conversation_messages(session, user_id, start, end, searched_channels)
 
-    # Merge and deduplicate by timestamp + channel
+    # Merge and deduplicate; a message ts is unique within its channel
     seen = set()
     unique_messages = []
-    for msg in messages + conversation_messages:
-        key = (msg.get("datetime"), msg.get("channel"))
+    for msg in chain(messages, conversation_messages):
+        key = (msg["ts"], msg["channel_id"])
         if key not in seen:
             seen.add(key)
             unique_messages.append(msg)
@@ -62,14 +86,31 @@ def get_slack_messages(
     return unique_messages
 
 
-def _get_user_id(headers: dict) -> Optional[str]:
+def _new_session(token: str) -> requests.Session:
+    """Create a keep-alive session authenticated with the Slack token."""
+    session = requests.Session()
+    session.headers.update({
+        "Authorization": f"Bearer {token}",
+        "Content-Type": "application/json"
+    })
+    # Slack answers rate-limited calls (search.messages in particular) with 429 and
+    # a Retry-After header; wait that out (capped, so a long Retry-After cannot
+    # stall the command) instead of failing the whole fetch
+    retry = CappedRetry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[429, 502, 503, 504],
+        allowed_methods=frozenset({"GET"}),
+        respect_retry_after_header=True,
+    )
+    session.mount("https://", HTTPAdapter(max_retries=retry))
+    return session
+
+
+def _get_user_id(token: str) -> Optional[str]:
     """Get the authenticated user's ID."""
     try:
-        response = requests.get(
-            "https://slack.com/api/auth.test",
-            headers=headers
-        )
-        data = response.json()
+        data = _auth_test(token)
         if data.get("ok"):
             return data.get("user_id")
     except Exception:
@@ -77,84 +118,126 @@ def _get_user_id(headers: dict) -> Optional[str]:
     return None
 
 
-def _search_messages(headers: dict, start: datetime, end: datetime) -> list[dict]:
-    """Search for messages using the search API."""
-    start_str = start.strftime("%Y-%m-%d")
-    end_str = end.strftime("%Y-%m-%d")
+def _search_messages(session: requests.Session, start: datetime, end: datetime) -> tuple[list[dict], bool]:
+    """
+    Search for messages using the search API.
+
+    Returns the in-range messages and whether every match in the range was
+    seen: False when a page could not be fetched.
+    """
+    # after:/before: take whole days and exclude the named ones, so widen by a
+    # day on each side and filter on timestamps below
+    start_str = (start - timedelta(days=1)).strftime("%Y-%m-%d")
+    end_str = (end + timedelta(days=1)).strftime("%Y-%m-%d")
     query = f"from:me after:{start_str} before:{end_str}"
 
     messages = []
-    cursor = None
-
-    while True:
-        params = {
-            "query": query,
-            "sort": "timestamp",
-            "sort_dir": "desc",
-            "count": 100,
-        }
-        if cursor:
-            params["cursor"] = cursor
 
-        try:
-            response = requests.get(
-                "https://slack.com/api/search.messages",
-                headers=headers,
-                params=params
-            )
-            data = response.json()
+    # Compare raw timestamps so out-of-range matches never build a datetime
+    start_ts = start.timestamp()
+    end_ts = end.timestamp()
 
-            if not data.get("ok"):
-                break
-
-            matches = data.get("messages", {}).get("matches", [])
-
-            for msg in matches:
-                ts = float(msg.get("ts", 0))
-                msg_dt = datetime.fromtimestamp(ts)
-
-                if start <= msg_dt <= end:
-                    channel_info = msg.get("channel", {})
-                    channel_name = channel_info.get("name", "unknown")
-                    is_dm = channel_info.get("is_im", False)
-                    is_group_dm = channel_info.get("is_mpim", False)
-
-                    if is_dm:
-                        channel_name = "DM"
-                    elif is_group_dm:
-                        channel_name = "Group DM"
-
-                    messages.append({
-                        "time": msg_dt.strftime("%H:%M"),
-                        "datetime": msg_dt,
-                        "channel": channel_name,
-                        "channel_type": "dm" if is_dm else ("group_dm" if is_group_dm else "channel"),
-                        "text": msg.get("text", ""),
-                        "permalink": msg.get("permalink", ""),
-                    })
-
-            paging = data.get("messages", {}).get("paging", {})
-            if paging.get("page", 1) >= paging.get("pages", 1):
-                break
-
-            next_cursor = data.get("response_metadata", {}).get("next_cursor")
-            if not next_cursor:
-                break
-            cursor = next_cursor
-
-        except Exception:
-            break
+    params = {
+        "query": query,
+        "sort": "timestamp",
+        "sort_dir": "desc",
+        "count": 100,  # search.messages caps pages at 100 matches
+    }
 
-    return messages
+    try:
+        first = _search_page(session, params, 1)
+    except Exception:
+        return messages, False
+    if not first.get("ok"):
+        return messages, False
+
+    # The first page reports the page count, so the rest can be fetched a few at a time.
+    # Matches are sorted newest first, so once a page ends before start no later
+    # page can hold an in-range message
+    pages = [first]
+    complete = True
+    total_pages = first.get("messages", {}).get("paging", {}).get("pages", 1)
+    if total_pages > 1 and not _ends_before(first, start_ts):
+        with ThreadPoolExecutor(max_workers=min(SEARCH_WORKERS, total_pages - 1)) as pool:
+            futures = [pool.submit(_search_page, session, params, page) for page in range(2, total_pages + 1)]
+            for i, future in enumerate(futures):
+                try:
+                    data = future.result()
+                except Exception:
+                    data = {}
+                if data.get("ok"):
+                    pages.append(data)
+                else:
+                    complete = False
+                if not data.get("ok") or _ends_before(data, start_ts):
+                    # Drop pages that have not started yet
+                    for pending in futures[i + 1:]:
+                        pending.cancel()
+                    break
+
+    # Reshape every page's raw matches in one pass once pagination is done
+    raw = chain.from_iterable(data.get("messages", {}).get("matches", []) for data in pages)
+    in_range = [(msg, ts) for msg in raw if start_ts <= (ts := float(msg.get("ts", 0))) <= end_ts]
+
+    fromtimestamp = datetime.fromtimestamp
+    append = messages.append
+    for msg, ts in in_range:
+        msg_dt = fromtimestamp(ts)
+        channel_info = msg.get("channel", {})
+        is_dm = channel_info.get("is_im", False)
+        is_group_dm = channel_info.get("is_mpim", False)
+
+        if is_dm:
+            channel_name, channel_type = "DM", "dm"
+        elif is_group_dm:
+            channel_name, channel_type = "Group DM", "group_dm"
+        else:
+            channel_name, channel_type = channel_info.get("name", "unknown"), "channel"
+
+        append({
+            "time": f"{msg_dt.hour:02d}:{msg_dt.minute:02d}",
+            "datetime": msg_dt,
+            "channel": channel_name,
+            "channel_id": channel_info.get("id"),
+            "channel_type": channel_type,
+            "ts": msg.get("ts"),
+            "text": msg.get("text", ""),
+            "permalink": msg.get("permalink", ""),
+        })
+
+    return messages, complete
+
+
+def _ends_before(data: dict, start_ts: float) -> bool:
+    """Whether a newest-first search page's last match is older than start_ts."""
+    matches = data.get("messages", {}).get("matches", [])
+    return bool(matches) and float(matches[-1].get("ts", 0)) < start_ts
+
+
+def _search_page(session: requests.Session, params: dict, page: int) -> dict:
+    """Fetch one page of search.messages results."""
+    response = session.get(
+        "https://slack.com/api/search.messages",
+        params={**params, "page": page},
+        timeout=REQUEST_TIMEOUT,
+    )
+    response.raise_for_status()
+    return loads_json(response.content)
 
 
 def _get_conversation_messages(
-    headers: dict,
+    session: requests.Session,
     user_id: str,
     start: datetime,
-    end: datetime
+    end: datetime,
+    searched_channels: Optional[set[str]] = None,
 ) -> list[dict]:
-    """Get messages from all conversations (DMs, group DMs, channels)."""
+    """
+    Get messages from the user's conversations (DMs, group DMs, channels).
+
+    When searched_channels is given, public channels outside it are skipped:
+    search already covers them, so their history would add nothing.
+    """
     if not user_id:
         return []
 
@@ -165,33 +248,24 @@ def _get_conversation_messages(
     latest = str(end.timestamp())
 
     # Get all conversations the user is part of
-    conversations = _list_conversations(headers)
-
-    for conv in conversations:
-        conv_id = conv.get("id")
-        conv_name = conv.get("name", "Unknown")
-        conv_type = conv.get("type", "channel")
-
-        try:
-            # Fetch history for this conversation
-            params = {
-                "channel": conv_id,
-                "oldest": oldest,
-                "latest": latest,
-                "limit": 200,
-            }
-
-            response = requests.get(
-                "https://slack.com/api/conversations.history",
-                headers=headers,
-                params=params
-            )
-            data = response.json()
-
-            if not data.get("ok"):
-                continue
-
-            for msg in data.get("messages", []):
+    conversations = _list_conversations(session)
+    if searched_channels is not None:
+        conversations = [
+            conv for conv in conversations
+            if conv["type"] != "channel" or conv["id"] in searched_channels
+        ]
+    if not conversations:
+        return messages
+
+    # Histories are independent, so fetch them concurrently; results keep conversation order
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(conversations))) as pool:
+        histories = pool.map(lambda conv: _conversation_history(session, conv["id"], oldest, latest), conversations)
+
+        for conv, history in zip(conversations, histories):
+            conv_name = conv.get("name", "Unknown")
+            conv_type = conv.get("type", "channel")
+
+            for msg in history:
                 # Only include messages from the user
                 if msg.get("user") != user_id:
                     continue
@@ -201,24 +275,55 @@ def _get_conversation_messages(
 
                 if start <= msg_dt <= end:
                     messages.append({
-                        "time": msg_dt.strftime("%H:%M"),
+                        "time": f"{msg_dt.hour:02d}:{msg_dt.minute:02d}",
                         "datetime": msg_dt,
                         "channel": conv_name,
+                        "channel_id": conv["id"],
                         "channel_type": conv_type,
+                        "ts": msg.get("ts"),
                         "text": msg.get("text", ""),
                         "permalink": "",  # Would need another API call
                     })
 
-        except Exception:
-            continue
-
     return messages
 
 
-def _list_conversations(headers: dict) -> list[dict]:
-    """List all conversations (DMs, group DMs, channels) the user is in."""
+def _conversation_history(session: requests.Session, conv_id: str, oldest: str, latest: str) -> list[dict]:
+    """Fetch one conversation's messages in a time window; errors yield no messages."""
+    try:
+        params = {
+            "channel": conv_id,
+            "oldest": oldest,
+            "latest": latest,
+            "limit": 200,
+        }
+
+        response = session.get(
+            "https://slack.com/api/conversations.history",
+            params=params,
+            timeout=REQUEST_TIMEOUT,
+        )
+        data = loads_json(response.content)
+
+        if not data.get("ok"):
+            return []
+        return data.get("messages", [])
+
+    except Exception:
+        return []
+
+
+def _list_conversations(session: requests.Session) -> list[dict]:
+    """
+    List all conversations (DMs, group DMs, channels) the user is in.
+
+    users.conversations returns only the user's memberships, where
+    conversations.list would also return every public channel in the workspace.
+    """
     conversations = []
     cursor = None
+    # Workspace display names, loaded in one users.list sweep at the first DM
+    user_names = None
 
     # Types: im (DM), mpim (group DM), public_channel, private_channel
     types = "im,mpim,public_channel,private_channel"
@@ -233,12 +338,12 @@ def _list_conversations(headers: dict) -> list[dict]:
             params["cursor"] = cursor
 
         try:
-            response = requests.get(
-                "https://slack.com/api/conversations.list",
-                headers=headers,
-                params=params
+            response = session.get(
+                "https://slack.com/api/users.conversations",
+                params=params,
+                timeout=REQUEST_TIMEOUT,
             )
-            data = response.json()
+            data = loads_json(response.content)
 
             if not data.get("ok"):
                 break
@@ -249,8 +354,12 @@ def _list_conversations(headers: dict) -> list[dict]:
                 is_mpim = conv.get("is_mpim", False)
 
                 if is_im:
-                    # For DMs, get the other user's name
-                    conv_name = _get_dm_user_name(headers, conv.get("user")) or "DM"
+                    # For DMs, get the other user's name; users.info covers anyone
+                    # missing from the directory, such as external Slack Connect users
+                    if user_names is None:
+                        user_names = _user_directory(session)
+                    other = conv.get("user")
+                    conv_name = user_names.get(other) or _get_dm_user_name(session, other) or "DM"
                     conv_type = "dm"
                 elif is_mpim:
                     conv_name = conv.get("name", "Group DM")
@@ -276,30 +385,84 @@ def _list_conversations(headers: dict) -> list[dict]:
     return conversations
 
 
-def _get_dm_user_name(headers: dict, user_id: str) -> Optional[str]:
+# Keyed on the token rather than the session, so names carry over between fetches
+@ttl_cache(
+    ttl=USER_CACHE_TTL,
+    maxsize=256,
+    key=lambda session, user_id: (session.headers.get("Authorization"), user_id),
+)
+def _get_dm_user_name(session: requests.Session, user_id: str) -> Optional[str]:
     """Get a user's display name for DM labeling."""
     if not user_id:
         return None
 
     try:
-        response = requests.get(
+        response = session.get(
             "https://slack.com/api/users.info",
-            headers=headers,
-            params={"user": user_id}
+            params={"user": user_id},
+            timeout=REQUEST_TIMEOUT,
         )
-        data = response.json()
+        data = loads_json(response.content)
         if data.get("ok"):
-            user = data.get("user", {})
-            return (
-                user.get("profile", {}).get("display_name") or
-                user.get("profile", {}).get("real_name") or
-                user.get("name")
-            )
+            return _display_name(data.get("user", {}))
     except Exception:
         pass
     return None
 
 
+@ttl_cache(
+    ttl=USER_CACHE_TTL,
+    maxsize=4,
+    key=lambda session: session.headers.get("Authorization"),
+)
+def _user_directory(session: requests.Session) -> dict[str, str]:
+    """Map every workspace user ID to its display name with users.list."""
+    names = {}
+    cursor = None
+
+    while True:
+        params = {"limit": 1000}
+        if cursor:
+            params["cursor"] = cursor
+
+        try:
+            response = session.get(
+                "https://slack.com/api/users.list",
+                params=params,
+                timeout=REQUEST_TIMEOUT,
+            )
+            data = loads_json(response.content)
+        except Exception:
+            break
+        if not data.get("ok"):
+            break
+
+        for user in data.get("members", []):
+            name = _display_name(user)
+            if name:
+                names[user.get("id")] = name
+
+        cursor = data.get("response_metadata", {}).get("next_cursor")
+        if not cursor:
+            break
+
+    return names
+
+
+def _display_name(user: dict) -> Optional[str]:
+    """Pick the best label for a Slack user object."""
+    profile = user.get("profile", {})
+    return profile.get("display_name") or profile.get("real_name") or user.get("name")
+
+
+@ttl_cache(ttl=AUTH_CACHE_TTL)
+def _auth_test(token: str) -> dict:
+    """Call auth.test for a token."""
+    with _new_session(token) as session:
+        response = session.get("https://slack.com/api/auth.test", timeout=REQUEST_TIMEOUT)
+    return loads_json(response.content)
+
+
 def test_slack_connection(config: dict) -> bool:
     """Test if Slack connection is working."""
     token = config.get("slack_token")
@@ -307,13 +470,7 @@ def test_slack_connection(config: dict) -> bool:
         return False
 
     try:
-        headers = {"Authorization": f"Bearer {token}"}
-        response = requests.get(
-            "https://slack.com/api/auth.test",
-            headers=headers
-        )
-        data = response.json()
-        return data.get("ok", False)
+        return _auth_test(token).get("ok", False)
     except Exception:
         return False
 
@@ -325,12 +482,7 @@ def get_slack_user_info(config: dict) -> Optional[dict]:
         return None
 
     try:
-        headers = {"Authorization": f"Bearer {token}"}
-        response = requests.get(
-            "https://slack.com/api/auth.test",
-            headers=headers
-        )
-        data = response.json()
+        data = _auth_test(token)
         if data.get("ok"):
             return {
                 "user": data.get("user"),
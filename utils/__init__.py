@@ -4,18 +4,23 @@ Utility functions for Worklog CLI.
 
 from utils.dates import (
     parse_date,
+    parse_iso_datetime,
     parse_week,
     parse_month,
     get_date_range,
     get_week_range,
     get_month_range,
 )
+from utils.serialization import dumps_json, loads_json
 
 __all__ = [
     "parse_date",
+    "parse_iso_datetime",
     "parse_week",
     "parse_month",
     "get_date_range",
     "get_week_range",
     "get_month_range",
+    "dumps_json",
+    "loads_json",
 ]
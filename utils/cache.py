@@ -0,0 +1,105 @@
+"""
+Response caches for Worklog CLI.
+On-disk entries are small JSON files under ~/.worklog/cache that expire after
+a TTL and are then deleted; ttl_cache memoizes function results in memory for
+the process lifetime.
+"""
+
+import hashlib
+import os
+import time
+from functools import wraps
+from typing import Any, Callable, Hashable, Optional
+
+from config import CACHE_DIR, ensure_config_dir
+from utils.serialization import dumps_json, loads_json
+
+# Seconds between sweeps that delete expired cache files nobody reads again
+SWEEP_INTERVAL = 24 * 60 * 60
+
+
+def _cache_file(namespace: str, key: str):
+    """Path of the cache file for a namespace and key."""
+    digest = hashlib.sha256(key.encode()).hexdigest()[:16]
+    return CACHE_DIR / f"{namespace}_{digest}.json"
+
+
+def cache_get(namespace: str, key: str) -> Optional[Any]:
+    """Return a cached value, or None if it is missing or expired; expired files are deleted."""
+    cache_file = _cache_file(namespace, key)
+    try:
+        with open(cache_file, "rb") as f:
+            cached = loads_json(f.read())
+        if cached.get("expires_at", 0) > time.time():
+            return cached["data"]
+        # Keys carry date ranges and URLs, so stale files would otherwise pile up
+        cache_file.unlink(missing_ok=True)
+    except (OSError, ValueError, KeyError):
+        pass
+    return None
+
+
+def cache_set(namespace: str, key: str, value: Any, ttl: float):
+    """Store a value for ttl seconds; failures to write are ignored."""
+    cache_file = _cache_file(namespace, key)
+    try:
+        ensure_config_dir()
+        CACHE_DIR.mkdir(mode=0o700, exist_ok=True)
+        with open(cache_file, "w") as f:
+            f.write(dumps_json({"expires_at": time.time() + ttl, "data": value}))
+        os.chmod(cache_file, 0o600)
+        _sweep_expired()
+    except OSError:
+        pass
+
+
+def _sweep_expired():
+    """Delete expired cache files, at most once per SWEEP_INTERVAL."""
+    marker = CACHE_DIR / ".last_sweep"
+    now = time.time()
+    try:
+        if now - marker.stat().st_mtime < SWEEP_INTERVAL:
+            return
+    except FileNotFoundError:
+        pass
+    marker.touch()
+
+    for path in CACHE_DIR.glob("*.json"):
+        try:
+            with open(path, "rb") as f:
+                expires_at = loads_json(f.read()).get("expires_at", 0)
+            if expires_at <= now:
+                path.unlink(missing_ok=True)
+        except (OSError, ValueError, AttributeError):
+            pass
+
+
+def ttl_cache(ttl: float, maxsize: int = 32, key: Optional[Callable[..., Hashable]] = None):
+    """
+    Memoize a function's results in memory for ttl seconds.
+
+    Arguments must be hashable; for methods the instance is part of the key, so
+    each instance keeps its own entries. A key function, called with the same
+    arguments, can pick the key instead, e.g. to leave out a session object.
+    The oldest entry is evicted once maxsize is reached.
+    """
+    def decorator(func):
+        entries: dict[Hashable, tuple[float, Any]] = {}
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            cache_key = key(*args, **kwargs) if key else (args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            hit = entries.get(cache_key)
+            if hit and hit[0] > now:
+                return hit[1]
+
+            value = func(*args, **kwargs)
+            if len(entries) >= maxsize:
+                entries.pop(next(iter(entries)), None)
+            entries[cache_key] = (now + ttl, value)
+            return value
+
+        wrapper.cache_clear = entries.clear
+        return wrapper
+    return decorator
@@ -3,13 +3,41 @@ Date parsing and range utilities for Worklog CLI.
 """
 
 import calendar as cal
+import sys
 from datetime import datetime, timedelta
 
+if sys.version_info >= (3, 11):
+    # fromisoformat accepts a trailing "Z" natively from 3.11
+    parse_iso_datetime = datetime.fromisoformat
+else:
+    try:
+        from ciso8601 import parse_datetime as parse_iso_datetime
+    except ImportError:
+        def parse_iso_datetime(value: str) -> datetime:
+            """Parse an RFC 3339 timestamp that may end in "Z"."""
+            return datetime.fromisoformat(value[:-1] + "+00:00" if value.endswith("Z") else value)
+
+
+# Accepted parse_date formats, tried in order after the ISO fast path
+_DATE_FORMATS = ("%Y-%m-%d", "%d/%m/%Y", "%m/%d/%Y")
+
 
 def parse_date(date_str: str) -> datetime:
     """Parse a date string in various formats."""
-    formats = ["%Y-%m-%d", "%d/%m/%Y", "%m/%d/%Y"]
-    for fmt in formats:
+    # YYYY-MM-DD is by far the most common input; fromisoformat skips strptime's format parsing.
+    # The shape is checked first: from 3.11 fromisoformat also takes forms like "2024-W03-1"
+    if (
+        len(date_str) == 10
+        and date_str[4] == date_str[7] == "-"
+        and date_str.isascii()
+        and (date_str[:4] + date_str[5:7] + date_str[8:]).isdigit()
+    ):
+        try:
+            return datetime.fromisoformat(date_str)
+        except ValueError:
+            pass
+
+    for fmt in _DATE_FORMATS:
         try:
             return datetime.strptime(date_str, fmt)
         except ValueError:
@@ -50,20 +78,25 @@ def parse_week(week_str: str) -> tuple[int, int]:
         return datetime.now().year, int(week_str)
 
 
+# (month number, full name) by the first three letters of the name, which are unique
+_MONTH_PREFIXES = {
+    name[:3]: (number, name)
+    for number, name in enumerate((
+        'january', 'february', 'march', 'april', 'may', 'june',
+        'july', 'august', 'september', 'october', 'november', 'december',
+    ), start=1)
+}
+
+
 def parse_month(month_str: str) -> tuple[int, int]:
     """Parse a month string like '2024-01', 'January', or just '1' for current year."""
-    month_names = {
-        'january': 1, 'february': 2, 'march': 3, 'april': 4,
-        'may': 5, 'june': 6, 'july': 7, 'august': 8,
-        'september': 9, 'october': 10, 'november': 11, 'december': 12,
-        'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'jun': 6,
-        'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
-    }
-
     if '-' in month_str:
         parts = month_str.split('-')
         return int(parts[0]), int(parts[1])
-    elif month_str.lower() in month_names:
-        return datetime.now().year, month_names[month_str.lower()]
-    else:
-        return datetime.now().year, int(month_str)
+
+    # 'jan', 'January' and 'sept' are all prefixes of the full name; 'mayday' is not
+    name = month_str.lower()
+    match = _MONTH_PREFIXES.get(name[:3])
+    if match is not None and len(name) >= 3 and match[1].startswith(name):
+        return datetime.now().year, match[0]
+    return datetime.now().year, int(month_str)
@@ -0,0 +1,20 @@
+"""
+HTTP helpers for Worklog CLI.
+"""
+
+from urllib3.util.retry import Retry
+
+# Longest single wait between retries, in seconds, whether it comes from the
+# server's Retry-After header or from exponential backoff
+MAX_RETRY_WAIT = 5
+
+
+class CappedRetry(Retry):
+    """Retry policy that honours Retry-After but never sleeps longer than MAX_RETRY_WAIT."""
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else min(retry_after, MAX_RETRY_WAIT)
+
+    def get_backoff_time(self) -> float:
+        return min(super().get_backoff_time(), MAX_RETRY_WAIT)
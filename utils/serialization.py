@@ -0,0 +1,37 @@
+"""
+JSON serialization helpers for Worklog CLI.
+Uses orjson when it is installed and falls back to the stdlib json module.
+"""
+
+import json
+from dataclasses import asdict, is_dataclass
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _default(obj):
+    """Serialize dataclass records as objects and anything else unknown with str()."""
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    return str(obj)
+
+
+def dumps_json(obj, indent: bool = False) -> str:
+    """Serialize to a JSON string; dataclasses become objects, other unknown types str()."""
+    if orjson is not None:
+        # orjson serializes dataclasses natively
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=str, option=option).decode()
+    return json.dumps(obj, default=_default, indent=2 if indent else None)
+
+
+def loads_json(data):
+    """Parse a JSON string or bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
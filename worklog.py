@@ -10,11 +10,22 @@ With an AI-powered CTO agent for generating reports and insights.
 """
 
 import argparse
+import sys
 
-from commands import cmd_summary, cmd_day, cmd_week, cmd_month, cmd_chat, cmd_setup, cmd_projects
+import commands
+
+
+def _default_args() -> argparse.Namespace:
+    """Arguments the parser would produce for a bare "cto"."""
+    return argparse.Namespace(command=None, date=None, yesterday=False, json=False, no_cache=False)
 
 
 def main():
+    # A bare "cto" is the common case; run today's summary without building the parser
+    if len(sys.argv) == 1:
+        commands.cmd_summary(_default_args())
+        return
+
     parser = argparse.ArgumentParser(
         description="Worklog - Track your daily work across Calendar, Chrome, GitHub, and Slack",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -28,6 +39,7 @@ Examples:
   cto week 2                   Show week 2 of current year
   cto month                    Show current month's summary
   cto month january            Show January of current year
+  cto week --json              Print the week's data as JSON
   cto projects                 Show Linear projects by status
   cto projects --all           Include completed projects
   cto chat                     Start AI CTO agent conversation
@@ -38,24 +50,39 @@ Examples:
 
     subparsers = parser.add_subparsers(dest="command")
 
+    # Options shared by the summary commands; SUPPRESS keeps "cto --json day" from being reset
+    summary_options = argparse.ArgumentParser(add_help=False)
+    summary_options.add_argument(
+        "--json",
+        action="store_true",
+        default=argparse.SUPPRESS,
+        help="Print the fetched data as JSON instead of tables"
+    )
+    summary_options.add_argument(
+        "--no-cache",
+        action="store_true",
+        default=argparse.SUPPRESS,
+        help="Read Chrome history directly and delete its local cache"
+    )
+
     # Setup command
     setup_parser = subparsers.add_parser("setup", help="Configure API credentials")
-    setup_parser.set_defaults(func=cmd_setup)
+    setup_parser.set_defaults(func="cmd_setup")
 
     # Day command
-    day_parser = subparsers.add_parser("day", help="Show summary for a specific day")
+    day_parser = subparsers.add_parser("day", help="Show summary for a specific day", parents=[summary_options])
     day_parser.add_argument("date", nargs="?", help="Date (YYYY-MM-DD, DD/MM/YYYY, or MM/DD/YYYY)")
-    day_parser.set_defaults(func=cmd_day)
+    day_parser.set_defaults(func="cmd_day")
 
     # Week command
-    week_parser = subparsers.add_parser("week", help="Show week's summary")
+    week_parser = subparsers.add_parser("week", help="Show week's summary", parents=[summary_options])
     week_parser.add_argument("week", nargs="?", help="Week number (e.g., '3' or '2024-W03')")
-    week_parser.set_defaults(func=cmd_week)
+    week_parser.set_defaults(func="cmd_week")
 
     # Month command
-    month_parser = subparsers.add_parser("month", help="Show month's summary")
+    month_parser = subparsers.add_parser("month", help="Show month's summary", parents=[summary_options])
     month_parser.add_argument("month", nargs="?", help="Month (e.g., 'january', '1', or '2024-01')")
-    month_parser.set_defaults(func=cmd_month)
+    month_parser.set_defaults(func="cmd_month")
 
     # Chat command (AI CTO agent)
     chat_parser = subparsers.add_parser("chat", help="Start AI CTO agent conversation")
@@ -68,7 +95,13 @@ Examples:
         default="claude-sonnet-4-20250514",
         help="Claude model to use (default: claude-sonnet-4-20250514)"
     )
-    chat_parser.set_defaults(func=cmd_chat)
+    chat_parser.add_argument(
+        "--no-fullscreen",
+        dest="fullscreen",
+        action="store_false",
+        help="Run the conversation inline instead of in the alternate screen"
+    )
+    chat_parser.set_defaults(func="cmd_chat")
 
     # Projects command (Linear projects view)
     projects_parser = subparsers.add_parser("projects", help="Show Linear projects grouped by status")
@@ -77,18 +110,27 @@ Examples:
         action="store_true",
         help="Include completed and canceled projects"
     )
-    projects_parser.set_defaults(func=cmd_projects)
+    projects_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        default=argparse.SUPPRESS,
+        help="Bypass the short-lived projects cache"
+    )
+    projects_parser.set_defaults(func="cmd_projects")
 
     # Default command arguments (for running without subcommand)
     parser.add_argument("--date", "-d", help="Date to show summary for (YYYY-MM-DD)")
     parser.add_argument("--yesterday", "-y", action="store_true", help="Show yesterday's summary")
+    parser.add_argument("--json", action="store_true", help="Print the fetched data as JSON instead of tables")
+    parser.add_argument("--no-cache", action="store_true", help="Read Chrome history directly and delete its local cache")
 
     args = parser.parse_args()
 
+    # Handlers are named rather than imported so only the chosen command's modules load
     if args.command:
-        args.func(args)
+        getattr(commands, args.func)(args)
     else:
-        cmd_summary(args)
+        commands.cmd_summary(args)
 
 
 if __name__ == "__main__":